@@ -2,57 +2,110 @@
 from __future__ import annotations
 import argparse
 import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 import yaml
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
-import copy 
 from .models import *
+from .models import _construct
 from .parsers import AbstractParser
 from .processors import AbstractProcessor
 from .output import AbstractOutputPipe
 
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=32)
+def _load_cfg(path: str, mtime: float) -> dict:
+    # keyed by mtime so an edited config is re-read; treat the result as read-only
+    return yaml.load(Path(path).read_text(), Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=None)
 def _import(name: str) -> Any:
     module_name, _, class_name = name.rpartition(".")
     module = importlib.import_module(module_name)
     return getattr(module, class_name)
 
 
-def run(cfg_path: str | Path):
-    cfg = yaml.safe_load(Path(cfg_path).read_text())
+# combined input size from which parsers run in worker processes. Shipping the FinOps
+# back (pickle in the worker, unpickle here) costs about as much as parsing them, and
+# serial runs share the _asset cache, so only several large exports gain from a pool
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _input_bytes(p_conf: dict[str, Any]) -> int:
+    """Rough size of a parser's input: the files (or directory contents) its params name."""
+    total = 0
+    for value in p_conf.get("params", {}).values():
+        if not isinstance(value, str):
+            continue
+        path = Path(value)
+        if path.is_file():
+            total += path.stat().st_size
+        elif path.is_dir():
+            total += sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+    return total
+
 
-    # 1. instantiate parsers
+def _run_parser(p_conf: dict[str, Any], validate: bool = False) -> tuple[str, list]:
+    """Instantiate and run one parser; module-level so worker processes can pickle it."""
+    parser_cls: type[AbstractParser] = _import(p_conf["type"])
+    config_cls = parser_cls.config_model
+    config_obj = config_cls(**p_conf.get("params", {}))
+    parser = parser_cls(config_obj)
+    parser.validate = validate
+
+    return p_conf.get("name", parser_cls.__name__), parser.load().records
+
+
+def run(cfg_path: str | Path, validate: bool = False):
+    cfg_file = Path(cfg_path).resolve()
+    cfg = _load_cfg(str(cfg_file), cfg_file.stat().st_mtime)
+
+    # 1. parsers are independent: run them in worker processes (in config order)
+    #    and collect their FinOps in a single pass
     raw_results: list[RawDataOut] = []
-    dataframes = []
-    for p_conf in cfg["parsers"]:
-        parser_cls: type[AbstractParser] = _import(p_conf["type"])
-        config_cls = parser_cls.config_model
-        config_obj = config_cls(**p_conf.get("params", {}))
-        parser = parser_cls(config_obj)
-
-        df = parser.load()
-        dataframes.append(df)
-
-        # gather raw ops
-        raw_copy = copy.deepcopy(df["__object__"].tolist())
+    all_ops = []
+    p_confs = cfg["parsers"]
+    workers = min(len(p_confs), os.cpu_count() or 1)
+    if workers > 1 and sum(map(_input_bytes, p_confs)) >= _PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parsed = list(ex.map(_run_parser, p_confs, repeat(validate)))
+    else:
+        parsed = [_run_parser(p_conf, validate) for p_conf in p_confs]
+
+    for name, records in parsed:
+        # FinOps are immutable after parse, so the same list feeds both the raw
+        # results and the merged operations.
+        all_ops.extend(records)
         raw_results.append(
-            RawDataOut(
-                parser_name=p_conf.get("name", parser_cls.__name__),
-                records = raw_copy
+            _construct(
+                RawDataOut,
+                validate,
+                parser_name=name,
+                records = records
             )
         )
 
-    # 2. merge all FinOps
-    all_ops = []
-    for df in dataframes:
-        all_ops.extend(df["__object__"].tolist())
+    # both processors walk the operations chronologically: sort once here so their
+    # own (stable) sorts run over already ordered input
+    all_ops.sort(key=attrgetter("date"))
 
-    # 3. processors
+    # 2. processors
     results = []
     for pr_conf in cfg["processors"]:
         proc_cls: type[AbstractProcessor] = _import(pr_conf["type"])
         processor = proc_cls(**pr_conf.get("params", {}))
-        in_model = proc_cls.input_model(operations=copy.deepcopy(all_ops))
+        in_model = _construct(proc_cls.input_model, validate, operations=list(all_ops))
         results.append(processor.process(in_model))
 
     for r in results:
@@ -60,7 +113,7 @@ def run(cfg_path: str | Path):
             # in-place sort descending by absolute P/L
             r.summary.sort(key=lambda row: abs(row.pnl.amount), reverse=True)
 
-    # 4. output
+    # 3. output
     out_conf = cfg["output"]
     out_cls: type[AbstractOutputPipe] = _import(out_conf["type"])
     out_pipe = out_cls(**out_conf.get("params", {}))
@@ -70,8 +123,9 @@ def run(cfg_path: str | Path):
 def main():
     ap = argparse.ArgumentParser(description="Financial CSV CLI")
     ap.add_argument("--config", default="config.yaml", help="YAML config file")
+    ap.add_argument("--validate", action="store_true", help="validate parsed records, and re-validate them between stages")
     args = ap.parse_args()
-    run(args.config)
+    run(args.config, validate=args.validate)
 
 
 if __name__ == "__main__":
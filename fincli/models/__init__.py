@@ -1,25 +1,59 @@
 # file: fincli/models/__init__.py
 from __future__ import annotations
+import re
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Literal, Annotated
 
 import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from ..utils.fx import to_eur
+from ..utils.fx import to_eur, rates_asof
+
+CENT = Decimal("0.01")  # quantum for amounts rounded to cents
+_ISIN = re.compile(r"^[A-Z]{2}[A-Z0-9]{10}$")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Domain Value Objects
 # ──────────────────────────────────────────────────────────────────────────────
+# Value objects and FinOps are immutable once parsed: frozen (hashable, no
+# assignment checks) and closed to unknown fields.
+_RECORD_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
+def _construct(model_cls: type[BaseModel], validate: bool = False, **fields) -> BaseModel:
+    """Build a model from already-typed fields, skipping validation unless `validate` is set."""
+    if validate:
+        return model_cls(**fields)
+    return model_cls.model_construct(**fields)
+
+
 class Asset(BaseModel):
+    model_config = _RECORD_CONFIG
+
     name: str
-    isin: str | None = Field(None, pattern=r"[A-Z]{2}[A-Z0-9]{10}")
+    isin: str | None = None
     ticker: str | None = None
 
+    @field_validator("isin")
+    @classmethod
+    def _check_isin(cls, v: str | None) -> str | None:
+        if v is not None and not _ISIN.match(v):
+            raise ValueError(f"invalid ISIN: {v!r}")
+        return v
+
+    @cached_property
+    def key(self) -> str:
+        """Identity used to match lots: the ISIN when known, else the name (not a field)."""
+        return self.isin or self.name
+
 
 class Money(BaseModel):
+    # frozen → hashable, so defaults such as ZERO_EUR are shared instead of copied
+    model_config = _RECORD_CONFIG
+
     amount: Decimal
     currency: Literal["EUR", "USD", "GBP"]  # Enough for now, extend as needed
 
@@ -39,13 +73,51 @@ class Money(BaseModel):
         # perform lookup + conversion
         eur_amount = to_eur(self.currency, self.amount, on, Path(csv_path))
         # quantize to cents
-        eur_amount = eur_amount.quantize(Decimal("0.01"))
+        eur_amount = eur_amount.quantize(CENT)
 
-        return Money(amount=eur_amount, currency="EUR")
+        return _eur_money(eur_amount)
+
+    @classmethod
+    def batch_convert_to_eur(
+        cls,
+        monies: list[Money],
+        dates: list[datetime],
+        csv_path: str | Path = "utilsData/eurofxref-hist.csv",
+    ) -> list[Money]:
+        """
+        Same as `convert_to_eur` for a whole batch: EUR entries pass through,
+        the rest share a single vectorised FX lookup.
+        """
+        out = list(monies)
+        todo = [i for i, m in enumerate(monies) if m.currency != "EUR"]
+        if not todo:
+            return out
+
+        rates = rates_asof(
+            [monies[i].currency for i in todo],
+            [dates[i].date() for i in todo],
+            Path(csv_path),
+        )
+        for i, rate in zip(todo, rates):
+            out[i] = _eur_money((monies[i].amount / rate).quantize(CENT))
+        return out
     
     def __str__(self):
         return f"{self.amount:.2f} {self.currency}"
 
+
+
+def _eur_money(amount: Decimal) -> Money:
+    """Interned EUR Money for already-quantized amounts."""
+    return _interned_eur_money(amount.as_tuple(), amount)
+
+
+@lru_cache(maxsize=1024)
+def _interned_eur_money(key: tuple, amount: Decimal) -> Money:
+    # keyed on the digits, sign and exponent: 0.00 and -0.00 (or 1.0 and 1.00) compare and
+    # hash equal as Decimals, but must not share one cached Money
+    return Money.model_construct(amount=amount, currency="EUR")
+
     
 ZERO_EUR = Money(amount=Decimal(0), currency="EUR")
 
@@ -53,7 +125,9 @@ ZERO_EUR = Money(amount=Decimal(0), currency="EUR")
 # Financial Operations
 # ──────────────────────────────────────────────────────────────────────────────
 class BuyOperation(BaseModel):
-    class__: Literal["BuyOperation"] = Field("BuyOperation", Literal=True)
+    model_config = _RECORD_CONFIG
+
+    class__: Literal["BuyOperation"] = "BuyOperation"
     asset: Asset
     unit_price: Money
     quantity: Decimal
@@ -61,14 +135,14 @@ class BuyOperation(BaseModel):
     date: datetime
 
     def __str__(self):
-        base = (f"Bought {str(self.quantity)} × {self.asset.name} @ {str(self.unit_price)}"
-                f" on {self.date.date().isoformat()}")
-        if self.commission:
-            base += f" (commission: {str(self.commission)})"
-        return base
+        return (f"Bought {self.quantity} × {self.asset.name} @ {self.unit_price}"
+                f" on {self.date.date().isoformat()}"
+                f"{f' (commission: {self.commission})' if self.commission else ''}")
 
 class SellOperation(BaseModel):
-    class__: Literal["SellOperation"] = Field("SellOperation", Literal=True)
+    model_config = _RECORD_CONFIG
+
+    class__: Literal["SellOperation"] = "SellOperation"
     asset: Asset
     unit_price: Money
     quantity: Decimal
@@ -77,14 +151,14 @@ class SellOperation(BaseModel):
     date: datetime
 
     def __str__(self):
-        base = (f"Sold {str(self.quantity)} × {self.asset.name} @ {str(self.unit_price)}"
-                f" on {self.date.date().isoformat()}")
-        if self.commission:
-            base += f" (commission: {str(self.commission)})"
-        return base
+        return (f"Sold {self.quantity} × {self.asset.name} @ {self.unit_price}"
+                f" on {self.date.date().isoformat()}"
+                f"{f' (commission: {self.commission})' if self.commission else ''}")
 
 class Dividend(BaseModel):
-    class__: Literal["Dividend"] = Field("Dividend", Literal=True)
+    model_config = _RECORD_CONFIG
+
+    class__: Literal["Dividend"] = "Dividend"
     asset: Asset
     gross: Money
     date: datetime
@@ -96,7 +170,9 @@ class Dividend(BaseModel):
                 f" on {self.date.date().isoformat()} from {self.source or 'Unknown source'}")
 
 class Interest(BaseModel):
-    class__: Literal["Interest"] = Field("Interest", Literal=True)
+    model_config = _RECORD_CONFIG
+
+    class__: Literal["Interest"] = "Interest"
     gross: Money
     date: datetime
     tax: Money = ZERO_EUR
@@ -108,7 +184,9 @@ class Interest(BaseModel):
                 f" on {self.date.date().isoformat()} from {self.source or 'Unknown source'}")
 
 class AssetTrade(BaseModel):
-    class__: Literal["AssetTrade"] = Field("AssetTrade", Literal=True)
+    model_config = _RECORD_CONFIG
+
+    class__: Literal["AssetTrade"] = "AssetTrade"
     buy: BuyOperation
     sell: SellOperation
     pnl: Money  # positive = profit, negative = loss
@@ -133,12 +211,9 @@ class RawDataOut(BaseModel):
     records: List[FinOp]
 
     def __str__(self):
-        lines = [f"Parser: {self.parser_name}", "Records:"]
-        for op in self.records:
-            # indent each line of op.__str__()
-            for line in str(op).splitlines():
-                lines.append("  " + line)
-        return "\n".join(lines)
+        # indent every line of each op.__str__()
+        body = ("  " + str(op).replace("\n", "\n  ") for op in self.records)
+        return "\n".join((f"Parser: {self.parser_name}", "Records:", *body))
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Processor I/O Contracts
@@ -244,11 +319,14 @@ class XTBParserConfig(BaseModel):
       - trades_file: path to tradeOperations.csv
       - encoding:    file encoding (default 'utf-8')
       - sep:         delimiter (default ';')
+      - strict_pnl:  check each trade's P/L against XTB's "Resultado neto" (default False;
+                     also on with --validate)
     """
     cash_file: str
     trades_file: str
     encoding: str = "utf-8"
     sep: str = ";"
+    strict_pnl: bool = False
 
 class ManualInterestParserConfig(BaseModel):
     """
@@ -2,10 +2,23 @@ from __future__ import annotations
 from pathlib import Path
 from jinja2 import Environment, PackageLoader, select_autoescape
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from ..models import SavingPerformanceOut, TradingPerformanceOut
 from .abstract import AbstractOutputPipe
 
+
+def _dumps(obj, indent: int | None = None, **kwargs) -> str:
+    """`tojson` backend: pydantic-core's serializer handles models, Decimal and datetime natively.
+
+    Only `indent` has a to_json equivalent; any other json.dumps option (sort_keys, ...)
+    raises rather than being silently dropped.
+    """
+    if kwargs:
+        raise TypeError(f"tojson: unsupported json.dumps option(s) {', '.join(sorted(kwargs))}")
+    return to_json(obj, indent=indent, fallback=str).decode()
+
+
 class HtmlReportOutput(AbstractOutputPipe):
     """Simple, responsive HTML report (Bootstrap 5)."""
 
@@ -14,11 +27,18 @@ class HtmlReportOutput(AbstractOutputPipe):
         self.env = Environment(
             # point at the 'fincli.output' package and its 'templates' folder
             loader=PackageLoader("fincli.output", "templates"),
-            autoescape=select_autoescape()
+            autoescape=select_autoescape(),
+            auto_reload=False,
         )
+        # route the built-in `tojson` filter through pydantic-core (keeps its HTML-safe escaping)
+        self.env.policies["json.dumps_function"] = _dumps
+        self.env.policies["json.dumps_kwargs"] = {}
+        self._tpl = None  # compiled on first render, then reused
 
     def render(self, *results: BaseModel) -> str:
-        tpl = self.env.get_template("report.html")
-        html = tpl.render(results=results)
-        self.out_file.write_text(html, encoding="utf-8")
+        if self._tpl is None:
+            self._tpl = self.env.get_template("report.html")
+        # stream chunks straight to disk instead of building the whole document in memory
+        with self.out_file.open("w", encoding="utf-8") as fh:
+            self._tpl.stream(results=results).dump(fh)
         return str(self.out_file)
\ No newline at end of file
@@ -2,19 +2,20 @@
 from __future__ import annotations
 import datetime as dt # Renamed to dt to avoid conflict with models.datetime
 from decimal import Decimal
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import List, Literal, Annotated, Any, Union
-
-from abc import ABC, abstractmethod # Added for AbstractOutputPipe
+from typing import Any
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, BaseDocTemplate, KeepInFrame
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, BaseDocTemplate, Flowable
 )
+from reportlab.platypus.doctemplate import NullActionFlowable
 from reportlab.lib import colors
 from reportlab.lib.units import cm
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from .abstract import AbstractOutputPipe
 from ..models import *
 from pandas._libs.tslibs.nattype import NaTType  # Add this import at the top if pandas is used
@@ -31,6 +32,232 @@ POSITIVE_COLOR = colors.HexColor("#27AE60")
 NEGATIVE_COLOR = colors.HexColor("#C0392B")
 
 
+def _build_styles():
+    """Build the report stylesheet; done once at import and shared by every report."""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name="ReportTitle", fontSize=26, leading=32, spaceAfter=10,
+        textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", alignment=TA_CENTER
+    ))
+    styles.add(ParagraphStyle(
+        name="ReportSubTitle", fontSize=14, leading=18, spaceAfter=20,
+        textColor=SECONDARY_COLOR, alignment=TA_CENTER, fontName="Helvetica"
+    ))
+    styles.add(ParagraphStyle(
+        name="H1", fontSize=20, leading=24, spaceBefore=12, spaceAfter=8,
+        textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", keepWithNext=1
+    ))
+    styles.add(ParagraphStyle(
+        name="H2", fontSize=16, leading=20, spaceBefore=10, spaceAfter=6,
+        textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", keepWithNext=1
+    ))
+    styles.add(ParagraphStyle(
+        name="H3", fontSize=13, leading=16, spaceBefore=8, spaceAfter=4,
+        textColor=TEXT_COLOR, fontName="Helvetica-Bold", keepWithNext=1
+    ))
+    normal_style = styles['Normal']
+    normal_style.textColor = TEXT_COLOR; normal_style.fontSize = 10
+    normal_style.leading = 12; normal_style.spaceBefore = 2; normal_style.spaceAfter = 2
+    
+    styles.add(ParagraphStyle(name="NormalBold", parent=styles["Normal"], fontName="Helvetica-Bold"))
+    
+    styles.add(ParagraphStyle(name="SmallText", parent=styles["Normal"], fontSize=8.5, leading=10, textColor=colors.HexColor("#566573")))
+    styles.add(ParagraphStyle(name="SmallTextBold", parent=styles["SmallText"], fontName="Helvetica-Bold"))
+    styles.add(ParagraphStyle(name="SmallTextBoldRight", parent=styles["SmallTextBold"], alignment=TA_RIGHT, splitLongWords=0))
+
+
+    # Right-aligned styles hold amounts: never split a number mid-token (Pos/NegPnl inherit this)
+    styles.add(ParagraphStyle(name="RightAlign", parent=styles["Normal"], alignment=TA_RIGHT, splitLongWords=0))
+    
+    styles.add(ParagraphStyle(name="TableHeader", parent=styles["NormalBold"], textColor=WHITE, alignment=TA_CENTER, fontSize=9))
+    
+    styles.add(ParagraphStyle(name="TableCell", parent=styles["Normal"], alignment=TA_LEFT, fontSize=9))
+    styles.add(ParagraphStyle(name="TableCellRight", parent=styles["TableCell"], alignment=TA_RIGHT, splitLongWords=0))
+    
+    styles.add(ParagraphStyle(name="TableCellSmall", parent=styles["SmallText"], alignment=TA_LEFT))
+    styles.add(ParagraphStyle(name="TableCellSmallRight", parent=styles["TableCellSmall"], alignment=TA_RIGHT, splitLongWords=0))
+    
+    styles.add(ParagraphStyle(name="PositivePnl", parent=styles["TableCellSmallRight"], textColor=POSITIVE_COLOR, fontName="Helvetica-Bold"))
+    styles.add(ParagraphStyle(name="NegativePnl", parent=styles["TableCellSmallRight"], textColor=NEGATIVE_COLOR, fontName="Helvetica-Bold"))
+    return styles
+
+
+_STYLES = _build_styles()
+
+
+def _small_cell_cmds(start: tuple[int, int], stop: tuple[int, int]) -> list[tuple]:
+    """TableStyle equivalent of the TableCellSmall paragraph style, for plain-string cells."""
+    cell = _STYLES["TableCellSmall"]
+    return [
+        ('FONTNAME', start, stop, cell.fontName),
+        ('FONTSIZE', start, stop, cell.fontSize),
+        ('LEADING', start, stop, cell.leading),
+        ('TEXTCOLOR', start, stop, cell.textColor),
+    ]
+
+
+# --- Static table layout: header texts and the base TableStyle every table of a kind shares ---
+_PASSIVE_HEADER_TEXTS = ("Date", "Source/Asset", "Type", "Gross", "Tax Paid", "Net")
+_TRADE_HEADER_TEXTS = ("Buy Date", "Sell Date", "Qty", "Buy Price", "Sell Price", "Comm.", "Tax (Sell)", "P/L")
+_RAW_HEADER_TEXTS = ("Date", "Type", "Asset/Details", "Qty/Gross", "Price/Tax", "Comm.", "Source")
+
+_PASSIVE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), 
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
+    ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+    ('LEFTPADDING', (0,0), (-1,-1), 5), ('RIGHTPADDING', (0,0), (-1,-1), 5),
+    ('TOPPADDING', (0,0), (-1,-1), 4), ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+    *_small_cell_cmds((0, 1), (-1, -1)),
+    ('ALIGN', (3, 1), (-1, -1), 'RIGHT'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [LIGHT_GREY, None]),
+])
+_TRADE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), 
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
+    ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+    ('LEFTPADDING', (0,0), (-1,-1), 4), ('RIGHTPADDING', (0,0), (-1,-1), 4),
+    ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    *_small_cell_cmds((0, 1), (-1, -2)),
+    ('ALIGN', (2, 1), (-1, -2), 'RIGHT'),
+    # Totals row styling
+    ('SPAN', (0, -1), (4, -1)), 
+    ('ALIGN', (0, -1), (0, -1), 'LEFT'), # For the "Asset Totals:" text itself
+    ('BACKGROUND', (0, -1), (-1, -1), MID_GREY), 
+    ('ROWBACKGROUNDS', (0, 1), (-1, -2), [LIGHT_GREY, None]),
+])
+_RAW_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), SECONDARY_COLOR), 
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'), 
+    ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
+    ('LEFTPADDING', (0,0), (-1,-1), 4), ('RIGHTPADDING', (0,0), (-1,-1), 4),
+    ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    *_small_cell_cmds((0, 1), (-1, -1)),
+    ('ALIGN', (3, 1), (5, -1), 'RIGHT'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [LIGHT_GREY, None]),
+])
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6), ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 8), ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0,0), (-1,-1), 0.5, BORDER_COLOR),
+    ('FONTNAME', (0, 1), (-1, -1), _STYLES["TableCell"].fontName),
+    ('FONTSIZE', (0, 1), (-1, -1), _STYLES["TableCell"].fontSize),
+    ('LEADING', (0, 1), (-1, -1), _STYLES["TableCell"].leading),
+    ('TEXTCOLOR', (0, 1), (-1, -1), _STYLES["TableCell"].textColor),
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'), # Amount column
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), # Header
+    ('FONTNAME', (0, 0), (-1, 0), _STYLES["TableHeader"].fontName),
+    ('FONTSIZE', (0, 0), (-1, 0), _STYLES["TableHeader"].fontSize),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _STYLES["TableHeader"].textColor),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [LIGHT_GREY, None]),
+])
+
+
+# Report tables repeat the same few amounts (zero commissions/taxes, shared unit prices) many
+# times over. Keyed on str(amount) rather than the Decimal so -0 and 0, which compare equal
+# but format differently, stay apart.
+@lru_cache(maxsize=4096)
+def _fmt_money_str(amount_str: str, currency: str) -> str:
+    return f"{Decimal(amount_str):.2f} {currency}" # same text as Money.__str__
+
+
+@lru_cache(maxsize=4096)
+def _fmt_decimal_str(dec_str: str, precision: int) -> str:
+    return f"{Decimal(dec_str):,.{precision}f}"
+
+
+def _fit_cell(text: str, width: float, font_name: str = "Helvetica") -> str:
+    """Break a plain-string cell before its last word when it would overflow `width`,
+    as Paragraph wrapping did (e.g. '12,345.67 EUR' in a narrow money column)."""
+    if " " not in text or stringWidth(text, font_name, _STYLES["TableCellSmall"].fontSize) <= width:
+        return text
+    return "\n".join(text.rsplit(" ", 1))
+
+
+@lru_cache(maxsize=1024)
+def _asset_label(asset: Asset, source: str | None = None) -> str:
+    """'Name (TICKER) via source' in one f-string; Asset is frozen, so labels are cached per asset."""
+    return f"{asset.name}{f' ({asset.ticker})' if asset.ticker else ''}{f' via {source}' if source else ''}"
+
+
+# --- Raw-data appendix rows: one handler per FinOp type, dispatched on type(op) ---
+# Each returns (asset/details, qty/gross, price/tax, commission, source).
+_RAW_UNKNOWN = ("N/A", "N/A", "N/A", "N/A", "N/A")
+
+
+def _raw_interest(op: Interest, fmt_money, fmt_dec, parser_name: str) -> tuple[str, ...]:
+    return (op.source or "Interest Income", fmt_money(op.gross), fmt_money(op.tax, "-"),
+            fmt_money(op.commission, "-"), op.source or "")
+
+
+def _raw_dividend(op: Dividend, fmt_money, fmt_dec, parser_name: str) -> tuple[str, ...]:
+    asset_details_str = _asset_label(op.asset, op.source)
+    # Dividend model has no commission field
+    return asset_details_str, fmt_money(op.gross), fmt_money(op.tax, "-"), "-", op.source or ""
+
+
+def _raw_buy(op: BuyOperation, fmt_money, fmt_dec, parser_name: str) -> tuple[str, ...]:
+    asset_details_str = _asset_label(op.asset)
+    return (asset_details_str, fmt_dec(op.quantity, 4), fmt_money(op.unit_price),
+            fmt_money(op.commission, "-"), parser_name)
+
+
+def _raw_sell(op: SellOperation, fmt_money, fmt_dec, parser_name: str) -> tuple[str, ...]:
+    asset_details_str, qty_gross_str, unit_price_fmt, comm_str, source = _raw_buy(op, fmt_money, fmt_dec, parser_name)
+    sell_tax_fmt = fmt_money(op.tax, "-")
+    if sell_tax_fmt != "-" and sell_tax_fmt != fmt_money(ZERO_EUR, "-"):
+        price_tax_str = f"{unit_price_fmt} (Tax: {sell_tax_fmt})"
+    else:
+        price_tax_str = unit_price_fmt
+    return asset_details_str, qty_gross_str, price_tax_str, comm_str, source
+
+
+def _raw_trade(op: AssetTrade, fmt_money, fmt_dec, parser_name: str) -> tuple[str, ...]:
+    asset_details_str = _asset_label(op.buy.asset)
+    price_tax_str = f"Buy: {fmt_money(op.buy.unit_price)}, Sell: {fmt_money(op.sell.unit_price)}"
+    # Show combined or sell commission for AssetTrade. Sell is usually more relevant for PNL.
+    return (asset_details_str, f"PnL: {fmt_money(op.pnl)}", price_tax_str,
+            fmt_money(op.sell.commission, "-"), "Processor Aggregated")
+
+
+_RAW_HANDLERS = {
+    Interest: _raw_interest,
+    Dividend: _raw_dividend,
+    BuyOperation: _raw_buy,
+    SellOperation: _raw_sell,
+    AssetTrade: _raw_trade,
+}
+
+
+class _LazySection(Flowable):
+    """
+    Stand-in for a report section whose flowables are only built when layout reaches it.
+
+    It never fits, so the frame asks it to split; the split hands back the real flowables
+    (behind a no-op action so the doc template queues them all) and drops the builder.
+    Peak memory is then one section's tables rather than the whole report's. This leans on
+    how platypus splits flowables; tests/test_pdf_report.py renders a multi-page report to
+    catch a ReportLab upgrade that changes it.
+    """
+    _ZEROSIZE = True # split even when the frame is already full
+
+    def __init__(self, build):
+        super().__init__()
+        self._build = build
+
+    def wrap(self, availWidth, availHeight):
+        return availWidth, 0x7fffffff
+
+    def split(self, availWidth, availHeight):
+        build, self._build = self._build, None
+        return [NullActionFlowable(), *build()] if build else []
+
+    def draw(self):
+        pass
+
+
 class PdfReportOutput(AbstractOutputPipe):
     """Generates a visually appealing PDF tax report using ReportLab."""
 
@@ -44,7 +271,7 @@ class PdfReportOutput(AbstractOutputPipe):
         self.author_name = author_name
         self.report_period = report_period
 
-        self.styles = getSampleStyleSheet()
+        self.styles = _STYLES
         self.page_width, self.page_height = A4
         
         self.left_margin = 1.8 * cm
@@ -54,54 +281,8 @@ class PdfReportOutput(AbstractOutputPipe):
         
         self.content_width = self.page_width - self.left_margin - self.right_margin
 
-        self._define_styles()
         self.elements: list = []
 
-    def _define_styles(self): 
-        self.styles.add(ParagraphStyle(
-            name="ReportTitle", fontSize=26, leading=32, spaceAfter=10,
-            textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", alignment=TA_CENTER
-        ))
-        self.styles.add(ParagraphStyle(
-            name="ReportSubTitle", fontSize=14, leading=18, spaceAfter=20,
-            textColor=SECONDARY_COLOR, alignment=TA_CENTER, fontName="Helvetica"
-        ))
-        self.styles.add(ParagraphStyle(
-            name="H1", fontSize=20, leading=24, spaceBefore=12, spaceAfter=8,
-            textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", keepWithNext=1
-        ))
-        self.styles.add(ParagraphStyle(
-            name="H2", fontSize=16, leading=20, spaceBefore=10, spaceAfter=6,
-            textColor=PRIMARY_COLOR, fontName="Helvetica-Bold", keepWithNext=1
-        ))
-        self.styles.add(ParagraphStyle(
-            name="H3", fontSize=13, leading=16, spaceBefore=8, spaceAfter=4,
-            textColor=TEXT_COLOR, fontName="Helvetica-Bold", keepWithNext=1
-        ))
-        normal_style = self.styles['Normal']
-        normal_style.textColor = TEXT_COLOR; normal_style.fontSize = 10
-        normal_style.leading = 12; normal_style.spaceBefore = 2; normal_style.spaceAfter = 2
-        
-        self.styles.add(ParagraphStyle(name="NormalBold", parent=self.styles["Normal"], fontName="Helvetica-Bold"))
-        
-        self.styles.add(ParagraphStyle(name="SmallText", parent=self.styles["Normal"], fontSize=8.5, leading=10, textColor=colors.HexColor("#566573")))
-        self.styles.add(ParagraphStyle(name="SmallTextBold", parent=self.styles["SmallText"], fontName="Helvetica-Bold"))
-        self.styles.add(ParagraphStyle(name="SmallTextBoldRight", parent=self.styles["SmallTextBold"], alignment=TA_RIGHT))
-
-
-        self.styles.add(ParagraphStyle(name="RightAlign", parent=self.styles["Normal"], alignment=TA_RIGHT))
-        
-        self.styles.add(ParagraphStyle(name="TableHeader", parent=self.styles["NormalBold"], textColor=WHITE, alignment=TA_CENTER, fontSize=9))
-        
-        self.styles.add(ParagraphStyle(name="TableCell", parent=self.styles["Normal"], alignment=TA_LEFT, fontSize=9))
-        self.styles.add(ParagraphStyle(name="TableCellRight", parent=self.styles["TableCell"], alignment=TA_RIGHT))
-        
-        self.styles.add(ParagraphStyle(name="TableCellSmall", parent=self.styles["SmallText"], alignment=TA_LEFT))
-        self.styles.add(ParagraphStyle(name="TableCellSmallRight", parent=self.styles["TableCellSmall"], alignment=TA_RIGHT))
-        
-        self.styles.add(ParagraphStyle(name="PositivePnl", parent=self.styles["TableCellSmallRight"], textColor=POSITIVE_COLOR, fontName="Helvetica-Bold"))
-        self.styles.add(ParagraphStyle(name="NegativePnl", parent=self.styles["TableCellSmallRight"], textColor=NEGATIVE_COLOR, fontName="Helvetica-Bold"))
-
     def _header_footer(self, canvas, doc: BaseDocTemplate): 
         canvas.saveState()
         footer_text = f"Page {doc.page} | {self.report_main_title}"
@@ -122,14 +303,30 @@ class PdfReportOutput(AbstractOutputPipe):
 
     def _format_money(self, money_obj: Money | None, default_str: str = "N/A") -> str:
         if isinstance(money_obj, Money):
-            return str(money_obj) 
+            return _fmt_money_str(str(money_obj.amount), money_obj.currency)
         return default_str
     
     def _format_decimal(self, dec_val: Decimal | None, precision: int = 2, default_str: str = "N/A") -> str:
         if isinstance(dec_val, Decimal):
-            return f"{dec_val:,.{precision}f}"
+            return _fmt_decimal_str(str(dec_val), precision)
         return default_str
 
+    # Header rows are built once per report and shared by every table: Table does not mutate its cells.
+    def _header_row(self, *texts: str) -> list[Paragraph]:
+        return [Paragraph(text, self.styles["TableHeader"]) for text in texts]
+
+    @cached_property
+    def _passive_header(self) -> list[Paragraph]:
+        return self._header_row(*_PASSIVE_HEADER_TEXTS)
+
+    @cached_property
+    def _trading_header(self) -> list[Paragraph]:
+        return self._header_row(*_TRADE_HEADER_TEXTS)
+
+    @cached_property
+    def _raw_header(self) -> list[Paragraph]:
+        return self._header_row(*_RAW_HEADER_TEXTS)
+
     def _add_cover_page(self): 
         self.elements.append(Spacer(1, self.page_height / 5))
         self.elements.append(Paragraph(self.report_main_title, self.styles["ReportTitle"]))
@@ -141,44 +338,49 @@ class PdfReportOutput(AbstractOutputPipe):
         self.elements.append(Paragraph(f"Report Date: {current_date_str}", self.styles["Normal"]))
         self.elements.append(PageBreak())
 
-    def _build_summary_table(self, data: list[list[Any]], col_widths: list[float]): 
-        processed_data = []
-        for row_idx, row in enumerate(data):
-            processed_row = []
-            for cell_idx, cell_content in enumerate(row):
-                if not isinstance(cell_content, (Paragraph, Spacer, Table, KeepInFrame)):
-                    style_to_use = self.styles["TableCell"] # Default for data cells
-                    if row_idx == 0: # Header row
-                        style_to_use = self.styles["TableHeader"]
-                    elif cell_idx == 1 : # Amount column (index 1) in data rows
-                         style_to_use = self.styles["TableCellRight"]
-                    # First column of data rows can be bold if needed:
-                    # elif cell_idx == 0 and row_idx > 0: style_to_use = self.styles["NormalBold"]
-                    
-                    processed_row.append(Paragraph(str(cell_content) if cell_content is not None else "", style_to_use))
-                else: # cell_content is already a Flowable (e.g. Spacer)
-                    processed_row.append(cell_content)
-            processed_data.append(processed_row)
-        
-        table = Table(processed_data, colWidths=col_widths, hAlign='LEFT')
-        style_cmds = [
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6), ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 8), ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), # Header background
-            ('GRID', (0,0), (-1,-1), 0.5, BORDER_COLOR),
-        ]
-        # Alternating row colors for data rows
-        for i_row in range(1, len(processed_data)): # Start from 1 for data rows
-            if i_row % 2 == 1: # Odd data rows (1st, 3rd, etc. data row)
-                 if not isinstance(processed_data[i_row][0], Spacer): # Don't color spacer rows
-                    style_cmds.append(('BACKGROUND', (0, i_row), (-1, i_row), LIGHT_GREY))
-        
-        table.setStyle(TableStyle(style_cmds))
+    def _build_summary_table(self, data: list[list[Any]], col_widths: list[float]):
+        """Summary table for a header row plus plain-string rows (and Spacer separators).
+
+        Strings go straight into the table and take their font, colour and alignment from
+        TableStyle commands instead of being wrapped in a Paragraph each.
+        """
+        table = Table(data, colWidths=col_widths, hAlign='LEFT')
+        table.setStyle(_SUMMARY_TABLE_STYLE)
         self.elements.append(table)
         self.elements.append(Spacer(1, 1*cm))
 
-    def _add_overall_summary(self, savings_data: SavingPerformanceOut | None, trading_data: TradingPerformanceOut | None):
+    def _precompute_totals(self, savings_data: SavingPerformanceOut | None, trading_data: TradingPerformanceOut | None) -> dict[str, Any]:
+        """Every figure the summary and the per-asset footers need, in one walk over the data."""
+        totals: dict[str, Any] = {}
+        if savings_data:
+            totals["passive_tax"] = sum(
+                (op.tax.amount for op in savings_data.records if isinstance(op, (Interest, Dividend)) and op.tax),
+                Decimal(0),
+            )
+        if trading_data:
+            # per-asset (pnl, commission, tax, commission currency, tax currency), parallel to
+            # trading_data.summary; one walk over the trades, the display loop only formats
+            asset_totals = []
+            for a in trading_data.summary:
+                comm = tax = Decimal(0)
+                for t in a.trades:
+                    sell = t.sell
+                    if sell.commission: comm += sell.commission.amount
+                    if sell.tax: tax += sell.tax.amount
+                comm_ccy = tax_ccy = a.pnl.currency
+                if a.trades:
+                    first = a.trades[0].sell
+                    if first.commission: comm_ccy = first.commission.currency
+                    if first.tax: tax_ccy = first.tax.currency
+                asset_totals.append((a.pnl, comm, tax, comm_ccy, tax_ccy))
+            totals["asset_totals"] = asset_totals
+            totals["realized_pnl"] = sum((pnl.amount for pnl, *_ in asset_totals), Decimal(0))
+            totals["trading_commissions"] = sum((c for _, c, _, _, _ in asset_totals), Decimal(0))
+            totals["trading_taxes"] = sum((t for _, _, t, _, _ in asset_totals), Decimal(0))
+        return totals
+
+    def _add_overall_summary(self, savings_data: SavingPerformanceOut | None, trading_data: TradingPerformanceOut | None,
+                             totals: dict[str, Any]):
         self.elements.append(Paragraph("Overall Financial Summary", self.styles["H1"]))
         summary_rows_data = [["Category", "Amount (EUR)"]] 
         has_data = False
@@ -186,11 +388,7 @@ class PdfReportOutput(AbstractOutputPipe):
         if savings_data:
             has_data = True
             total_gross_income = savings_data.total_eur 
-            total_passive_tax_decimal = Decimal(0)
-            for op in savings_data.records:
-                if isinstance(op, (Interest, Dividend)) and op.tax: # Ensure op.tax is Money
-                    total_passive_tax_decimal += op.tax.amount
-            
+            total_passive_tax_decimal = totals["passive_tax"]
             net_passive_income = total_gross_income - total_passive_tax_decimal
 
             summary_rows_data.extend([
@@ -201,18 +399,10 @@ class PdfReportOutput(AbstractOutputPipe):
 
         if trading_data:
             has_data = True
-            total_net_realized_pnl_dec = Decimal(0)
-            total_trading_commissions_dec = Decimal(0)
-            total_transaction_taxes_dec = Decimal(0)
-
-            for asset_pnl in trading_data.summary:
-                total_net_realized_pnl_dec += asset_pnl.pnl.amount # Assuming pnl is EUR and Money
-                for trade in asset_pnl.trades:
-                    if trade.sell.commission: # Ensure is Money
-                         total_trading_commissions_dec += trade.sell.commission.amount 
-                    if trade.sell.tax: # Ensure is Money
-                         total_transaction_taxes_dec += trade.sell.tax.amount 
-            
+            total_net_realized_pnl_dec = totals["realized_pnl"]
+            total_trading_commissions_dec = totals["trading_commissions"]
+            total_transaction_taxes_dec = totals["trading_taxes"]
+
             if savings_data and summary_rows_data and not isinstance(summary_rows_data[-1][0], Spacer):
                  summary_rows_data.append([Spacer(0,0.2*cm), Spacer(0,0.2*cm)])
             
@@ -224,7 +414,7 @@ class PdfReportOutput(AbstractOutputPipe):
         
         if has_data:
             col_widths = [self.content_width * 0.65, self.content_width * 0.35]
-            self._build_summary_table(summary_rows_data, col_widths) 
+            self._build_summary_table(summary_rows_data, col_widths)
         else:
             self.elements.append(Paragraph("No financial data available for summary.", self.styles["Normal"]))
         self.elements.append(PageBreak())
@@ -235,14 +425,25 @@ class PdfReportOutput(AbstractOutputPipe):
             title += f" ({savings.year})"
         self.elements.append(Paragraph(title, self.styles["H1"]))
         
-        tbl_header = [
-            Paragraph("Date", self.styles["TableHeader"]), Paragraph("Source/Asset", self.styles["TableHeader"]),
-            Paragraph("Type", self.styles["TableHeader"]),
-            Paragraph("Gross", self.styles["TableHeader"]), Paragraph("Tax Paid", self.styles["TableHeader"]),
-            Paragraph("Net", self.styles["TableHeader"]),
-        ]
-        tbl_data = [tbl_header]
+        tbl_data = [self._passive_header]
 
+        fixed_cols_width = 2*cm + 2*cm + 2.5*cm + 2.5*cm + 2.5*cm 
+        source_col_width = self.content_width - fixed_cols_width
+        min_source_col_width = 4*cm # Ensure minimum width for source/asset details
+        if source_col_width < min_source_col_width: source_col_width = min_source_col_width
+            
+        col_widths = [2*cm, source_col_width, 2*cm, 2.5*cm, 2.5*cm, 2.5*cm]
+        # Rescale if total width is not matching content_width (e.g. if source_col_width was capped)
+        current_sum = sum(col_widths)
+        if abs(current_sum - self.content_width) > 0.01 * cm: # Check for significant deviation
+             scale = self.content_width / current_sum
+             col_widths = [w * scale for w in col_widths]
+
+        num_w = col_widths[3] - 10 # text width left in the money columns after padding
+        cell_s = self.styles["TableCellSmall"]
+        fmt_money = self._format_money
+        fmt_dec = self._format_decimal
+        safe_date = self._safe_date_str
         for op in savings.records:
             if not isinstance(op, (Interest, Dividend)):
                 continue 
@@ -256,148 +457,113 @@ class PdfReportOutput(AbstractOutputPipe):
                 op_source_name = op.source or "Unknown Interest Source"
                 op_type_str = "Interest"
             elif isinstance(op, Dividend):
-                op_source_name = op.asset.name + (f" ({op.asset.ticker})" if op.asset.ticker else "")
-                if op.source: # Append dividend source if available
-                    op_source_name += f" via {op.source}"
+                op_source_name = _asset_label(op.asset, op.source) # dividend source appended if available
                 op_type_str = "Dividend"
             else: 
                 op_source_name = "Unknown Operation" # Should not happen with the guard clause
                 op_type_str = op.class__
 
             tbl_data.append([
-                Paragraph(op.date.date().strftime('%Y-%m-%d'), self.styles["TableCellSmall"]),
-                Paragraph(op_source_name, self.styles["TableCellSmall"]), # Potentially long, ensure width is adequate
-                Paragraph(op_type_str, self.styles["TableCellSmall"]),
-                Paragraph(self._format_money(op.gross), self.styles["TableCellSmallRight"]),
-                Paragraph(self._format_money(op.tax), self.styles["TableCellSmallRight"]),
-                Paragraph(f"{net_amount:,.2f} {op.gross.currency}", self.styles["TableCellSmallRight"]), 
+                safe_date(op.date),
+                Paragraph(op_source_name, cell_s), # Potentially long, ensure width is adequate
+                op_type_str,
+                _fit_cell(fmt_money(op.gross), num_w),
+                _fit_cell(fmt_money(op.tax), num_w),
+                _fit_cell(f"{fmt_dec(net_amount)} {op.gross.currency}", num_w),
             ])
         
         if len(tbl_data) > 1:
-            fixed_cols_width = 2*cm + 2*cm + 2.5*cm + 2.5*cm + 2.5*cm 
-            source_col_width = self.content_width - fixed_cols_width
-            min_source_col_width = 4*cm # Ensure minimum width for source/asset details
-            if source_col_width < min_source_col_width: source_col_width = min_source_col_width
-            
-            col_widths = [2*cm, source_col_width, 2*cm, 2.5*cm, 2.5*cm, 2.5*cm]
-            # Rescale if total width is not matching content_width (e.g. if source_col_width was capped)
-            current_sum = sum(col_widths)
-            if abs(current_sum - self.content_width) > 0.01 * cm: # Check for significant deviation
-                 scale = self.content_width / current_sum
-                 col_widths = [w * scale for w in col_widths]
-
 
             passive_table = Table(tbl_data, colWidths=col_widths, repeatRows=1)
-            style_cmds = [
-                ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), 
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
-                ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-                ('LEFTPADDING', (0,0), (-1,-1), 5), ('RIGHTPADDING', (0,0), (-1,-1), 5),
-                ('TOPPADDING', (0,0), (-1,-1), 4), ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-            ]
-            for i_row in range(1, len(tbl_data)): 
-                if i_row % 2 == 1: 
-                    style_cmds.append(('BACKGROUND', (0, i_row), (-1, i_row), LIGHT_GREY))
-            passive_table.setStyle(TableStyle(style_cmds))
+            passive_table.setStyle(_PASSIVE_TABLE_STYLE)
             self.elements.append(passive_table)
         else:
             self.elements.append(Paragraph("No passive income records for this period.", self.styles["Normal"]))
         self.elements.append(PageBreak())
 
-    def _add_trading_performance_details(self, trading: TradingPerformanceOut):
+    def _add_trading_performance_details(self, trading: TradingPerformanceOut, totals: dict[str, Any]):
         title = "Trading Performance Details (FIFO)"
         if trading.year and (not self.report_period or str(trading.year) not in self.report_period):
              title += f" ({trading.year})"
         self.elements.append(Paragraph(title, self.styles["H1"]))
 
-        for asset_pnl_summary in trading.summary: 
-            asset = asset_pnl_summary.asset
-            asset_name_str = asset.name + (f" ({asset.ticker})" if asset.ticker else "")
-            self.elements.append(Paragraph(f"Asset: {asset_name_str}", self.styles["H2"]))
-            
-            if not asset_pnl_summary.trades:
-                self.elements.append(Paragraph("No trades recorded for this asset.", self.styles["SmallText"]))
-                self.elements.append(Spacer(1, 0.5*cm))
-                continue
-
-            tbl_header = [
-                Paragraph("Buy Date", self.styles["TableHeader"]), Paragraph("Sell Date", self.styles["TableHeader"]),
-                Paragraph("Qty", self.styles["TableHeader"]), Paragraph("Buy Price", self.styles["TableHeader"]),
-                Paragraph("Sell Price", self.styles["TableHeader"]), Paragraph("Comm.", self.styles["TableHeader"]),
-                Paragraph("Tax (Sell)", self.styles["TableHeader"]), Paragraph("P/L", self.styles["TableHeader"]),
-            ]
-            tbl_data = [tbl_header]
+        col_widths = [1.9*cm, 1.9*cm, 1.8*cm, 2.3*cm, 2.3*cm, 2.0*cm, 2.0*cm, 2.3*cm]
+        current_sum = sum(col_widths)
+        if current_sum > self.content_width: # Scale down if too wide
+            scale = self.content_width / current_sum
+            col_widths = [w * scale for w in col_widths]
+        elif self.content_width - current_sum > 0.1 * cm: # Distribute remainder if significantly narrower
+            remainder = self.content_width - current_sum
+            # Distribute to price/pnl columns (indices 3,4,7) or asset name (if that was dynamic)
+            # For simplicity, add to the last P/L column
+            col_widths[-1] += remainder
             
-            asset_total_comm_dec = Decimal(0)
-            asset_total_tax_dec = Decimal(0)
-
-            for trade in asset_pnl_summary.trades: 
-                pnl_float = self._get_safe_float(trade.pnl)
-                
-                if trade.sell.commission: asset_total_comm_dec += trade.sell.commission.amount
-                if trade.sell.tax: asset_total_tax_dec += trade.sell.tax.amount
-
-                pnl_style = self.styles["PositivePnl"] if pnl_float > 0 else \
-                            (self.styles["NegativePnl"] if pnl_float < 0 else self.styles["TableCellSmallRight"])
-                
-                tbl_data.append([
-                    Paragraph(self._safe_date_str(trade.buy.date), self.styles["TableCellSmall"]),
-                    Paragraph(self._safe_date_str(trade.sell.date), self.styles["TableCellSmall"]),
-                    Paragraph(self._format_decimal(trade.sell.quantity, 4), self.styles["TableCellSmallRight"]),
-                    Paragraph(self._format_money(trade.buy.unit_price), self.styles["TableCellSmallRight"]),
-                    Paragraph(self._format_money(trade.sell.unit_price), self.styles["TableCellSmallRight"]),
-                    Paragraph(self._format_money(trade.sell.commission, "-"), self.styles["TableCellSmallRight"]),
-                    Paragraph(self._format_money(trade.sell.tax, "-"), self.styles["TableCellSmallRight"]),
-                    Paragraph(self._format_money(trade.pnl), pnl_style),
-                ])
-            
-            comm_currency_str = asset_pnl_summary.pnl.currency 
-            if asset_pnl_summary.trades and asset_pnl_summary.trades[0].sell.commission:
-                comm_currency_str = asset_pnl_summary.trades[0].sell.commission.currency
-            
-            tax_currency_str = asset_pnl_summary.pnl.currency 
-            if asset_pnl_summary.trades and asset_pnl_summary.trades[0].sell.tax:
-                tax_currency_str = asset_pnl_summary.trades[0].sell.tax.currency
+        for asset_pnl_summary, asset_totals in zip(trading.summary, totals["asset_totals"]):
+            self.elements.append(_LazySection(partial(
+                self._trading_asset_section, asset_pnl_summary, asset_totals, col_widths,
+            )))
+        self.elements.append(PageBreak())
+
+
+    def _trading_asset_section(self, asset_pnl_summary: AssetPNL, asset_totals: tuple,
+                               col_widths: list[float]) -> list:
+        """Heading + FIFO trade table for one asset; built lazily by `_LazySection`."""
+        fmt_money = self._format_money
+        fmt_dec = self._format_decimal
+        safe_date = self._safe_date_str
+        fit_w = [w - 8 for w in col_widths] # text width per column after padding
+
+        out: list = []
+        asset = asset_pnl_summary.asset
+        asset_name_str = _asset_label(asset)
+        out.append(Paragraph(f"Asset: {asset_name_str}", self.styles["H2"]))
+        
+        if not asset_pnl_summary.trades:
+            out.append(Paragraph("No trades recorded for this asset.", self.styles["SmallText"]))
+            out.append(Spacer(1, 0.5*cm))
+            return out
+
+        tbl_data = [self._trading_header]
+        
+        pnl_color_cmds = []
+
+        for trade in asset_pnl_summary.trades: 
+            pnl_float = self._get_safe_float(trade.pnl)
+
+            if pnl_float:
+                row = len(tbl_data)
+                pnl_color_cmds += [
+                    ('TEXTCOLOR', (7, row), (7, row), POSITIVE_COLOR if pnl_float > 0 else NEGATIVE_COLOR),
+                    ('FONTNAME', (7, row), (7, row), 'Helvetica-Bold'),
+                ]
             
-            # Asset Totals Row
             tbl_data.append([
-                Paragraph("Asset Totals:", self.styles["SmallTextBold"]), '', '', '', '', # Spanned cells
-                Paragraph(f"{asset_total_comm_dec:,.2f} {comm_currency_str}", self.styles["SmallTextBoldRight"]),
-                Paragraph(f"{asset_total_tax_dec:,.2f} {tax_currency_str}", self.styles["SmallTextBoldRight"]),
-                Paragraph(self._format_money(asset_pnl_summary.pnl), self.styles["SmallTextBoldRight"]), 
+                safe_date(trade.buy.date),
+                safe_date(trade.sell.date),
+                fmt_dec(trade.sell.quantity, 4),
+                _fit_cell(fmt_money(trade.buy.unit_price), fit_w[3]),
+                _fit_cell(fmt_money(trade.sell.unit_price), fit_w[4]),
+                _fit_cell(fmt_money(trade.sell.commission, "-"), fit_w[5]),
+                _fit_cell(fmt_money(trade.sell.tax, "-"), fit_w[6]),
+                _fit_cell(fmt_money(trade.pnl), fit_w[7], "Helvetica-Bold" if pnl_float else "Helvetica"),
             ])
-
-            col_widths = [1.9*cm, 1.9*cm, 1.8*cm, 2.3*cm, 2.3*cm, 2.0*cm, 2.0*cm, 2.3*cm]
-            current_sum = sum(col_widths)
-            if current_sum > self.content_width: # Scale down if too wide
-                scale = self.content_width / current_sum
-                col_widths = [w * scale for w in col_widths]
-            elif self.content_width - current_sum > 0.1 * cm: # Distribute remainder if significantly narrower
-                remainder = self.content_width - current_sum
-                # Distribute to price/pnl columns (indices 3,4,7) or asset name (if that was dynamic)
-                # For simplicity, add to the last P/L column
-                col_widths[-1] += remainder
-            
-            trade_table = Table(tbl_data, colWidths=col_widths, repeatRows=1)
-            style_cmds = [
-                ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR), 
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
-                ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-                ('LEFTPADDING', (0,0), (-1,-1), 4), ('RIGHTPADDING', (0,0), (-1,-1), 4),
-                ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-                # Totals row styling
-                ('SPAN', (0, -1), (4, -1)), 
-                ('ALIGN', (0, -1), (0, -1), 'LEFT'), # For the "Asset Totals:" text itself
-                ('BACKGROUND', (0, -1), (-1, -1), MID_GREY), 
-            ]
-            for i_row in range(1, len(tbl_data) -1):
-                if i_row % 2 == 1: 
-                    style_cmds.append(('BACKGROUND', (0, i_row), (-1, i_row), LIGHT_GREY))
-            trade_table.setStyle(TableStyle(style_cmds))
-            self.elements.append(trade_table)
-            self.elements.append(Spacer(1, 0.7*cm))
-        self.elements.append(PageBreak())
-
+        
+        asset_pnl, comm_total, tax_total, comm_ccy, tax_ccy = asset_totals
+        # Asset Totals Row
+        tbl_data.append([
+            Paragraph("Asset Totals:", self.styles["SmallTextBold"]), '', '', '', '', # Spanned cells
+            Paragraph(f"{fmt_dec(comm_total)} {comm_ccy}", self.styles["SmallTextBoldRight"]),
+            Paragraph(f"{fmt_dec(tax_total)} {tax_ccy}", self.styles["SmallTextBoldRight"]),
+            Paragraph(fmt_money(asset_pnl), self.styles["SmallTextBoldRight"]),
+        ])
+
+        trade_table = Table(tbl_data, colWidths=col_widths, repeatRows=1)
+        trade_table.setStyle(_TRADE_TABLE_STYLE)
+        if pnl_color_cmds:
+            trade_table.setStyle(TableStyle(pnl_color_cmds))
+        out.append(trade_table)
+        out.append(Spacer(1, 0.7*cm))
+        return out
 
     def _add_raw_data_details(self, raw_data_list: list[RawDataOut]):
         self.elements.append(Paragraph("Appendix: Raw Data Input", self.styles["H1"]))
@@ -405,107 +571,66 @@ class PdfReportOutput(AbstractOutputPipe):
             self.elements.append(Paragraph("No raw data provided.", self.styles["Normal"]))
             self.elements.append(PageBreak()); return
 
-        for raw_data_item in raw_data_list:
-            self.elements.append(Paragraph(f"Source Parser: {raw_data_item.parser_name}", self.styles["H2"]))
-            if not raw_data_item.records:
-                self.elements.append(Paragraph("No records from this parser.", self.styles["SmallText"]))
-                self.elements.append(Spacer(1, 0.3*cm)); continue
-
-            tbl_header_texts = ["Date", "Type", "Asset/Details", "Qty/Gross", "Price/Tax", "Comm.", "Source"]
-            tbl_header = [Paragraph(text, self.styles["TableHeader"]) for text in tbl_header_texts]
-            tbl_data = [tbl_header]
-
-            for op in raw_data_item.records: 
-                if isinstance(op.date, NaTType): # Handle NaT dates
-                    op_date = "N/A"
-                else:  
-                    op_date = op.date.date().strftime('%Y-%m-%d')
-                op_type_str = op.class__
-                asset_details_str, qty_gross_str, price_tax_str, comm_str, op_source_val_str = "N/A", "N/A", "N/A", "N/A", "N/A"
-
-                if isinstance(op, Interest):
-                    asset_details_str = op.source or "Interest Income"
-                    qty_gross_str = self._format_money(op.gross)
-                    price_tax_str = self._format_money(op.tax, "-")
-                    comm_str = self._format_money(op.commission, "-")
-                    op_source_val_str = op.source or ""
-                elif isinstance(op, Dividend):
-                    asset_details_str = op.asset.name + (f" ({op.asset.ticker})" if op.asset.ticker else "")
-                    if op.source: asset_details_str += f" via {op.source}"
-                    qty_gross_str = self._format_money(op.gross)
-                    price_tax_str = self._format_money(op.tax, "-")
-                    comm_str = "-" # Dividend model has no commission field
-                    op_source_val_str = op.source or ""
-                
-                elif isinstance(op, (BuyOperation, SellOperation)):
-                    asset_details_str = op.asset.name + (f" ({op.asset.ticker})" if op.asset.ticker else "")
-                    qty_gross_str = self._format_decimal(op.quantity, 4)
-                    unit_price_fmt = self._format_money(op.unit_price)
-                    comm_str = self._format_money(op.commission, "-")
-                    op_source_val_str = raw_data_item.parser_name # Default source
-                    if isinstance(op, SellOperation): 
-                        sell_tax_fmt = self._format_money(op.tax, "-")
-                        if sell_tax_fmt != "-" and sell_tax_fmt != self._format_money(ZERO_EUR, "-"):
-                             price_tax_str = f"{unit_price_fmt} (Tax: {sell_tax_fmt})"
-                        else:
-                             price_tax_str = unit_price_fmt
-                    else: # BuyOperation
-                        price_tax_str = unit_price_fmt
-                
-                elif isinstance(op, AssetTrade): 
-                    asset_details_str = op.buy.asset.name + (f" ({op.buy.asset.ticker})" if op.buy.asset.ticker else "")
-                    qty_gross_str = f"PnL: {self._format_money(op.pnl)}"
-                    buy_price_fmt = self._format_money(op.buy.unit_price)
-                    sell_price_fmt = self._format_money(op.sell.unit_price)
-                    price_tax_str = f"Buy: {buy_price_fmt}, Sell: {sell_price_fmt}"
-                    # Show combined or sell commission for AssetTrade. Sell is usually more relevant for PNL.
-                    comm_str = self._format_money(op.sell.commission, "-") 
-                    op_source_val_str = "Processor Aggregated"
-
-
-                tbl_data.append([
-                    Paragraph(op_date, self.styles["TableCellSmall"]),
-                    Paragraph(op_type_str, self.styles["TableCellSmall"]),
-                    Paragraph(asset_details_str, self.styles["TableCellSmall"]), # Potentially long
-                    Paragraph(qty_gross_str, self.styles["TableCellSmallRight"]),
-                    Paragraph(price_tax_str, self.styles["TableCellSmallRight"]),
-                    Paragraph(comm_str, self.styles["TableCellSmallRight"]),
-                    Paragraph(op_source_val_str, self.styles["TableCellSmall"]),
-                ])
-            
-            fixed_cols_width = sum([2*cm, # Date
-                                    2*cm, # Type
-                                    2.5*cm, # Qty/Gross
-                                    2.5*cm, # Price/Tax
-                                    2*cm, # Comm.
-                                    2*cm  # Source
-                                    ]) 
-            details_col_width = self.content_width - fixed_cols_width
-            min_details_col_width = 4*cm
-            if details_col_width < min_details_col_width: details_col_width = min_details_col_width
+        fixed_cols_width = sum([2*cm, # Date
+                                2*cm, # Type
+                                2.5*cm, # Qty/Gross
+                                2.5*cm, # Price/Tax
+                                2*cm, # Comm.
+                                2*cm  # Source
+                                ]) 
+        details_col_width = self.content_width - fixed_cols_width
+        min_details_col_width = 4*cm
+        if details_col_width < min_details_col_width: details_col_width = min_details_col_width
             
-            col_widths = [2*cm, 2*cm, details_col_width, 2.5*cm, 2.5*cm, 2*cm, 2*cm]
-            current_sum = sum(col_widths)
-            if abs(current_sum - self.content_width) > 0.01 * cm:
-                 scale = self.content_width / current_sum
-                 col_widths = [w * scale for w in col_widths]
-
-            raw_table = Table(tbl_data, colWidths=col_widths, repeatRows=1)
-            style_cmds = [
-                ('BACKGROUND', (0, 0), (-1, 0), SECONDARY_COLOR), 
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'), 
-                ('GRID', (0, 0), (-1, -1), 0.5, BORDER_COLOR),
-                ('LEFTPADDING', (0,0), (-1,-1), 4), ('RIGHTPADDING', (0,0), (-1,-1), 4),
-                ('TOPPADDING', (0,0), (-1,-1), 3), ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-            ]
-            for i_row in range(1, len(tbl_data)):
-                if i_row % 2 == 1: 
-                    style_cmds.append(('BACKGROUND', (0, i_row), (-1, i_row), LIGHT_GREY))
-            raw_table.setStyle(TableStyle(style_cmds))
-
-            self.elements.append(raw_table)
-            self.elements.append(Spacer(1, 0.7*cm))
+        col_widths = [2*cm, 2*cm, details_col_width, 2.5*cm, 2.5*cm, 2*cm, 2*cm]
+        current_sum = sum(col_widths)
+        if abs(current_sum - self.content_width) > 0.01 * cm:
+             scale = self.content_width / current_sum
+             col_widths = [w * scale for w in col_widths]
+
+        for raw_data_item in raw_data_list:
+            self.elements.append(_LazySection(partial(self._raw_data_section, raw_data_item, col_widths)))
         self.elements.append(PageBreak())
+    def _raw_data_section(self, raw_data_item: RawDataOut, col_widths: list[float]) -> list:
+        """Heading + record table for one parser's raw data; built lazily by `_LazySection`."""
+        cell_s = self.styles["TableCellSmall"]
+        cell_sr = self.styles["TableCellSmallRight"]
+        fmt_money = self._format_money
+        fmt_dec = self._format_decimal
+        safe_date = self._safe_date_str
+        qty_w, comm_w = col_widths[3] - 8, col_widths[5] - 8 # text width after padding
+
+        out: list = []
+        out.append(Paragraph(f"Source Parser: {raw_data_item.parser_name}", self.styles["H2"]))
+        if not raw_data_item.records:
+            out.append(Paragraph("No records from this parser.", self.styles["SmallText"]))
+            out.append(Spacer(1, 0.3*cm)); return out
+
+        records = raw_data_item.records
+        parser_name = raw_data_item.parser_name
+        get_handler = _RAW_HANDLERS.get
+        # One pass through the handlers, transposed into per-column sequences
+        details, qtys, prices, comms, sources = zip(*[
+            handler(op, fmt_money, fmt_dec, parser_name) if (handler := get_handler(type(op))) else _RAW_UNKNOWN
+            for op in records
+        ])
+        columns = (
+            [safe_date(op.date) for op in records],
+            [Paragraph(op.class__, cell_s) for op in records], # class names overflow the narrow column unless wrapped
+            [Paragraph(text, cell_s) for text in details], # Potentially long
+            [_fit_cell(text, qty_w) for text in qtys],
+            [Paragraph(text, cell_sr) for text in prices], # may carry the sell tax / both prices
+            [_fit_cell(text, comm_w) for text in comms],
+            [Paragraph(text, cell_s) for text in sources],
+        )
+        tbl_data = [self._raw_header, *map(list, zip(*columns))]
+
+        raw_table = Table(tbl_data, colWidths=col_widths, repeatRows=1)
+        raw_table.setStyle(_RAW_TABLE_STYLE)
+
+        out.append(raw_table)
+        out.append(Spacer(1, 0.7*cm))
+        return out
 
     def render(self, *all_results: Any) -> str: 
         self.elements = [] 
@@ -514,15 +639,19 @@ class PdfReportOutput(AbstractOutputPipe):
             leftMargin=self.left_margin, rightMargin=self.right_margin,
             topMargin=self.top_margin, bottomMargin=self.bottom_margin
         )
+        # one pass over the results: first savings/trading output wins, raw data is collected
         savings_data: SavingPerformanceOut | None = None
-        savings_data_list = [r for r in all_results if isinstance(r, SavingPerformanceOut)]
-        if len(savings_data_list) > 0:
-            savings_data = savings_data_list[0]  
         trading_data: TradingPerformanceOut | None = None
-        trading_data_list = [r for r in all_results if isinstance(r, TradingPerformanceOut)]
-        if len(trading_data_list) > 0:
-            trading_data = trading_data_list[0]
-        raw_data_list: list[RawDataOut] = [r for r in all_results if isinstance(r, RawDataOut)]
+        raw_data_list: list[RawDataOut] = []
+        for r in all_results:
+            if isinstance(r, RawDataOut):
+                raw_data_list.append(r)
+            elif isinstance(r, SavingPerformanceOut):
+                if savings_data is None:
+                    savings_data = r
+            elif isinstance(r, TradingPerformanceOut):
+                if trading_data is None:
+                    trading_data = r
 
         self._add_cover_page()
 
@@ -531,13 +660,14 @@ class PdfReportOutput(AbstractOutputPipe):
             doc.build(self.elements, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
             return str(self.out_file)
 
-        self._add_overall_summary(savings_data, trading_data)
+        totals = self._precompute_totals(savings_data, trading_data)
+        self._add_overall_summary(savings_data, trading_data, totals)
         
         if savings_data and savings_data.records:
              self._add_passive_income_details(savings_data)
         
         if trading_data and trading_data.summary:
-            self._add_trading_performance_details(trading_data)
+            self._add_trading_performance_details(trading_data, totals)
             
         if raw_data_list:
             self._add_raw_data_details(raw_data_list)
@@ -547,16 +677,14 @@ class PdfReportOutput(AbstractOutputPipe):
 
     def _safe_date_str(self, dt_obj):
         """Return a safe date string or 'N/A' if dt_obj is None or NaTType."""
-        if dt_obj is None:
-            return "N/A"
-        # Handle pandas NaTType
-        if type(dt_obj).__name__ == "NaTType" or str(dt_obj) == "NaT":
+        if dt_obj is None or isinstance(dt_obj, NaTType):
             return "N/A"
+        # isoformat() is CPython's fixed YYYY-MM-DD fast path, no strftime format parsing
         try:
-            return dt_obj.date().strftime('%Y-%m-%d')
+            return dt_obj.date().isoformat()
         except Exception:
             try:
-                return dt_obj.strftime('%Y-%m-%d')
+                return dt_obj.isoformat()
             except Exception:
                 return "N/A"
 
@@ -1,12 +1,32 @@
-"""Public façade for fincli.parsers"""
-from .abstract import AbstractParser
-from .trade_republic import TradeRepublicParser
-from .bingx import BingxParser
-from .binance import BinanceParser
-from .bitget import BitGetParser
-from .revolut import RevolutParser
-from .xtb import XTBParser
-from .manual_interest import ManualInterestParser
-
-__all__ = ["AbstractParser", "TradeRepublicParser", "BingxParser", "BinanceParser", "BitGetParser"]
-__all__ += ["RevolutParser", "XTBParser", "ManualInterestParser"]
+"""Public façade for fincli.parsers
+
+Concrete parsers are imported on first access (PEP 562), so a run only loads
+the modules its config names.
+"""
+from importlib import import_module
+
+from .abstract import AbstractParser, ParserResult
+
+_PARSERS = {
+    "TradeRepublicParser": "trade_republic",
+    "BingxParser": "bingx",
+    "BinanceParser": "binance",
+    "BitGetParser": "bitget",
+    "RevolutParser": "revolut",
+    "XTBParser": "xtb",
+    "ManualInterestParser": "manual_interest",
+}
+
+__all__ = ["AbstractParser", "ParserResult", *_PARSERS]
+
+
+def __getattr__(name: str):
+    if name in _PARSERS:
+        cls = getattr(import_module(f".{_PARSERS[name]}", __name__), name)
+        globals()[name] = cls  # later lookups skip __getattr__
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
@@ -1,18 +1,73 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Type
 from pydantic import BaseModel
 import pandas as pd
 
+from ..models import Asset, FinOp, _construct
+
+
+@lru_cache(maxsize=None)
+def _asset(name: str, ticker: str | None = None, isin: str | None = None) -> Asset:
+    """Shared, validated Asset per (name, ticker, isin): exports repeat a handful of symbols over many rows."""
+    return Asset(name=name, ticker=ticker, isin=isin)
+
+
+def _dec(raw: str | None, default: Decimal | None = None) -> Decimal:
+    """Exported amount text → finite Decimal.
+
+    Blank cells give `default`, or raise when there is none. NaN and infinities always
+    raise: records are built without Money's finite-number check (see `_construct`).
+    """
+    if raw is None or (isinstance(raw, str) and not raw.strip()):
+        if default is None:
+            raise ValueError("blank amount cell")
+        return default
+    value = Decimal(raw)
+    if not value.is_finite():
+        raise ValueError(f"non-finite amount {raw!r}")
+    return value
+
+
+def _read_frames(files: list[Path], **read_csv_kwargs) -> list[pd.DataFrame]:
+    """`pd.read_csv` every file, concurrently when there are several; order is kept.
+
+    Threads rather than processes: each parser already runs in its own worker
+    process (see cli), and the C tokenizer releases the GIL while parsing.
+    """
+    read = partial(pd.read_csv, **read_csv_kwargs)
+    if len(files) < 2:
+        return [read(f) for f in files]
+    with ThreadPoolExecutor(max_workers=min(len(files), 8)) as ex:
+        return list(ex.map(read, files))
+
+
+@dataclass
+class ParserResult:
+    """What a parser hands downstream: its FinOps."""
+
+    records: list[FinOp]
+
 
 class AbstractParser(ABC):
     """A data-source adapter."""
 
     config_model: Type[BaseModel]
+    # set by the CLI's --validate: build records with full pydantic validation
+    validate: bool = False
 
     def __init__(self, config: BaseModel):
         self.config = config
 
+    def _construct(self, model_cls: type[BaseModel], **fields) -> BaseModel:
+        """`models._construct` bound to this parser's `validate` flag."""
+        return _construct(model_cls, self.validate, **fields)
+
     @abstractmethod
-    def load(self) -> pd.DataFrame:
-        """Return a typed dataframe ready for downstream processors."""
\ No newline at end of file
+    def load(self) -> ParserResult:
+        """Return the parsed FinOps ready for downstream processors."""
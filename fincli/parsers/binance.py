@@ -3,10 +3,10 @@ from pathlib import Path
 from decimal import Decimal
 import pandas as pd
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _asset, _dec, _read_frames
 from ..models import (
     BinanceParserConfig,
-    Asset, Money,
+    Money,
     BuyOperation, SellOperation, Dividend, Interest, AssetTrade, FinOp,
 )
 
@@ -25,65 +25,66 @@ class BinanceParser(AbstractParser):
     def _load_files(self, path: str, trades=True) -> list[pd.DataFrame]:
         p = Path(path)
         files = [p] if p.is_file() else list(p.glob(self.config.glob))
-        dfs = []
-        for f in files:
-            dfs.append(pd.read_csv(f, sep=self.config.sep, encoding=self.config.encoding, 
-                                   parse_dates=["Acquired", "Sold"] if trades else ["Date"],))
-        return dfs
+        # amounts stay text so they reach Decimal exactly as exported; blank cells stay ""
+        # (not NaN) so _dec can tell them apart
+        return _read_frames(files, sep=self.config.sep, encoding=self.config.encoding, dtype=str,
+                            keep_default_na=False,
+                            parse_dates=["Acquired", "Sold"] if trades else ["Date"])
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         records: list[FinOp] = []
         # --- Trades ---
         trades_dfs = self._load_files(self.config.trades_path)
-        for df in trades_dfs:
+        if trades_dfs:
+            df = pd.concat(trades_dfs, ignore_index=True)
             df.columns = [str(c).replace(" ", "_").replace("(","").replace(")","") for c in df.columns]
-            for row in df.itertuples(index=False):
-                # fields from header:
-                # Currency name,Currency amount,Acquired,Sold,Proceeds (EUR),Cost basis (EUR),Gains (EUR),Holding period (Days),Transaction type,Label
-                base = row._asdict()["Currency_name"]
-                amt = Decimal(str(row._asdict()["Currency_amount"]))
-                acquired = row._asdict()["Acquired"]
-                sold = row._asdict()["Sold"]
-                proceeds = Decimal(str(row._asdict()["Proceeds_EUR"] or 0))
-                cost = Decimal(str(row._asdict()["Cost_basis_EUR"] or 0))
-                gains = Decimal(str(row._asdict()["Gains_EUR"] or 0))
-                asset = Asset(name=base, ticker=base)
-
+            # fields from header:
+            # Currency name,Currency amount,Acquired,Sold,Proceeds (EUR),Cost basis (EUR),Gains (EUR),Holding period (Days),Transaction type,Label
+            # Values are already typed by read_csv, so models are built without re-validation
+            zero = Decimal(0)
+            amts = [_dec(v) for v in df["Currency_amount"]]
+            proceeds = [_dec(v, zero) for v in df["Proceeds_EUR"]]
+            costs = [_dec(v, zero) for v in df["Cost_basis_EUR"]]
+            for base, amt, acquired, sold, proceed, cost in zip(
+                df["Currency_name"], amts, df["Acquired"], df["Sold"], proceeds, costs
+            ):
+                asset = _asset(base, base)
                 # build buy/sell pair
-                buy = BuyOperation(
+                buy = self._construct(
+                    BuyOperation,
                     asset=asset,
-                    unit_price=Money(amount=(cost / amt) if amt else Decimal(0), currency="EUR"),
+                    unit_price=self._construct(Money, amount=(cost / amt) if amt else Decimal(0), currency="EUR"),
                     quantity=amt,
                     commission=None,
                     date=acquired,
                 )
-                sell = SellOperation(
+                sell = self._construct(
+                    SellOperation,
                     asset=asset,
-                    unit_price=Money(amount=(proceeds / amt) if amt else Decimal(0), currency="EUR"),
+                    unit_price=self._construct(Money, amount=(proceed / amt) if amt else Decimal(0), currency="EUR"),
                     quantity=amt,
                     commission=None,
                     date=sold,
                 )
-                records+= [
-                    buy,sell
-                ]
+                records.append(buy)
+                records.append(sell)
         # --- Savings (rewards) ---
         savings_dfs = self._load_files(self.config.savings_path, trades=False)
-        for df in savings_dfs:
+        if savings_dfs:
+            df = pd.concat(savings_dfs, ignore_index=True)
             df.columns = [str(c).replace(" ", "_").replace("(","").replace(")","") for c in df.columns]
-            for row in df.itertuples(index=False):
-                # Date,Asset,Amount,Price per unit (EUR),Value (EUR),Transaction Type,Label
-                date = row._asdict()["Date"]
-                symbol = row._asdict()["Asset"]
-                amt = Decimal(str(row._asdict()["Amount"]))
-                value = Decimal(str(row._asdict()["Value_EUR"] or 0))
-                asset = Asset(name=symbol, ticker=symbol)
+            # Date,Asset,Amount,Price per unit (EUR),Value (EUR),Transaction Type,Label
+            values = [_dec(v, Decimal(0)) for v in df["Value_EUR"]]
+            for date, symbol, value in zip(df["Date"], df["Asset"], values):
                 # treat as dividend
                 records.append(
-                    Dividend(asset=asset, gross=Money(amount=value, currency="EUR"), date=date, source="Binance")
+                    self._construct(
+                        Dividend,
+                        asset=_asset(symbol, symbol),
+                        gross=self._construct(Money, amount=value, currency="EUR"),
+                        date=date,
+                        source="Binance",
+                    )
                 )
 
-        # assemble DataFrame
-        df_out = pd.DataFrame([r.model_dump() for r in records])
-        df_out["__object__"] = records
-        return df_out
+        return ParserResult(records)
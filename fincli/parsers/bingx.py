@@ -1,12 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
 from decimal import Decimal
-import pandas as pd
+from typing import get_args
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _asset, _dec, _read_frames
 from ..models import (
     BingxParserConfig,
-    Asset, Money,
+    Money,
     BuyOperation, SellOperation,
     FinOp,
 )
@@ -16,6 +16,8 @@ EQUIVALENCES = {
     "USDT": "USD",
     "USDC": "USD",
 }
+# what Money (and the FX table lookup) can represent
+_SUPPORTED_CURRENCIES = frozenset(get_args(Money.model_fields["currency"].annotation))
 
 
 class BingxParser(AbstractParser):
@@ -24,7 +26,7 @@ class BingxParser(AbstractParser):
     def __init__(self, config: BingxParserConfig):
         super().__init__(config)
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         """
         Load one or more Bingx CSVs, parse into FinOp objects:
           - 'Open Long'   → BuyOperation
@@ -40,53 +42,80 @@ class BingxParser(AbstractParser):
         
 
         records: list[FinOp] = []
-        for f in files:
-            df = pd.read_csv(
-                f,
-                sep=self.config.sep,
-                encoding=self.config.encoding,
-                parse_dates=["Time(UTC+8)"],
-            )
-            df = df.rename(columns={"Time(UTC+8)": "Time_UTC_8"})
+        zero = Decimal(0)
+        # Values are already typed by read_csv, so models are built without re-validation
+        frames = _read_frames(
+            files,
+            sep=self.config.sep,
+            encoding=self.config.encoding,
+            dtype=str, # amounts reach Decimal as exported, with no float round trip
+            keep_default_na=False, # blank cells stay "" for _dec, never NaN
+            parse_dates=["Time(UTC+8)"],
+        )
+        for df in frames:
+            df = df.rename(columns={"Time(UTC+8)": "Time_UTC_8", "Fee Coin": "Fee_Coin"})
+            # itertuples() cannot expose "Fee Coin" under that name, so the old
+            # row._asdict().get("Fee Coin") lookup always fell back to USDT
+            df["Fee_Coin"] = df["Fee_Coin"].replace("", "USDT") if "Fee_Coin" in df.columns else "USDT"
+            # pair split and currency equivalences resolved per column, not per row
+            # (not expand=True: that yields fewer than two columns on an empty frame or
+            # when no pair contains "-", and the assignment would raise)
+            parts = df["Pair"].str.split("-", n=1)
+            df["base"], df["quote"] = parts.str[0], parts.str[1]
+            df["quote_currency"] = df["quote"].map(EQUIVALENCES).fillna(df["quote"])
+            fee_currency = df["Fee_Coin"].map(EQUIVALENCES).fillna(df["Fee_Coin"])
+            # fee coins Money cannot represent (BNB, ...) keep the old behaviour of every
+            # fee: counted as USDT
+            df["fee_currency"] = fee_currency.where(fee_currency.isin(_SUPPORTED_CURRENCIES), EQUIVALENCES["USDT"])
+            # fail here, naming the coin, rather than deep inside the FX conversion
+            unsupported = set(df["quote_currency"]) - _SUPPORTED_CURRENCIES
+            if unsupported:
+                raise ValueError(
+                    f"BingX export uses unsupported quote currency {sorted(map(str, unsupported))}; "
+                    f"supported: {sorted(_SUPPORTED_CURRENCIES)}"
+                )
             for row in df.itertuples(index=False):
                 ts = row.Time_UTC_8
-                base, quote = row.Pair.split("-", 1)
-                asset = Asset(name=base, ticker=base, isin=None)
-                price = Decimal(str(row.DealPrice))
-                qty = Decimal(str(row.Quantity))
-                fee = Decimal(str(row.Fee or 0))
-                fee_coin = row._asdict().get("Fee Coin", "USDT")
-                quote_currency = EQUIVALENCES.get(quote, quote)
-                fee_currency = EQUIVALENCES.get(fee_coin, fee_coin)
+                asset = _asset(row.base, row.base)
+                price = _dec(row.DealPrice)
+                qty = _dec(row.Quantity)
+                fee = _dec(row.Fee, zero)
+                quote_currency = row.quote_currency
+                fee_currency = row.fee_currency
                 if row.Type == "Open Long":
                     records.append(
-                        BuyOperation(
+                        self._construct(
+                            BuyOperation,
                             asset=asset,
-                            unit_price=Money(amount=price, currency=quote_currency),
+                            unit_price=self._construct(Money, amount=price, currency=quote_currency),
                             quantity=qty,
-                            commission=Money(amount=fee, currency=fee_currency),
+                            commission=self._construct(Money, amount=fee, currency=fee_currency),
                             date=ts,
                         )
                     )
                 elif row.Type == "Close Long" or row.Type == "Liquidation Long":
                     records.append(
-                        SellOperation(
+                        self._construct(
+                            SellOperation,
                             asset=asset,
-                            unit_price=Money(amount=price, currency=quote_currency),
+                            unit_price=self._construct(Money, amount=price, currency=quote_currency),
                             quantity=qty,
-                            commission=Money(amount=fee, currency=fee_currency),
+                            commission=self._construct(Money, amount=fee, currency=fee_currency),
                             date=ts,
                         )
                     )
                 # ignore other types for now
 
 
-        # Convert to eur
-        for record in records:
-            if isinstance(record, (BuyOperation, SellOperation)):
-                record.unit_price = record.unit_price.convert_to_eur(on=record.date)
-                record.commission = record.commission.convert_to_eur(on=record.date)
-        # build DataFrame of flat fields + keep objects
-        df_out = pd.DataFrame([r.model_dump() for r in records])
-        df_out["__object__"] = records
-        return df_out
+        # Convert to eur: prices and commissions share a single batched FX lookup
+        n = len(records)
+        dates = [record.date for record in records]
+        converted = Money.batch_convert_to_eur(
+            [record.unit_price for record in records] + [record.commission for record in records],
+            dates + dates,
+        )
+        records = [
+            record.model_copy(update={"unit_price": price, "commission": commission})
+            for record, price, commission in zip(records, converted[:n], converted[n:])
+        ]
+        return ParserResult(records)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 from pathlib import Path
-from decimal import Decimal
-import pandas as pd
+from decimal import Decimal, InvalidOperation
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _asset, _dec, _read_frames
 from ..models import (
     BitGetParserConfig,
-    Asset, Money,
+    Money,
     BuyOperation, SellOperation, FinOp,
 )
 
@@ -15,11 +14,14 @@ EQUIVALENCES = {
     "USDC": "USD",
 }
 
+_ZERO = Decimal(0)
+
 def _to_decimal(val) -> Decimal:
+    # blank or unparseable cells count as zero; NaN / infinities still raise (see _dec)
     try:
-        return Decimal(str(val))
-    except:
-        return Decimal(0)
+        return _dec(val, _ZERO)
+    except InvalidOperation:
+        return _ZERO
 
 class BitGetParser(AbstractParser):
     """
@@ -34,104 +36,73 @@ class BitGetParser(AbstractParser):
     def __init__(self, config: BitGetParserConfig):
         super().__init__(config)
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         records: list[FinOp] = []
         p = Path(self.config.path)
         files = [p] if p.is_file() else list(p.glob(self.config.glob))
 
-        for f in files:
-            df = pd.read_csv(f, sep=self.config.sep, encoding=self.config.encoding, parse_dates=[0])
-            
+        # dtype=str: amounts reach Decimal as exported, with no float round trip
+        frames = _read_frames(files, sep=self.config.sep, encoding=self.config.encoding, dtype=str,
+                              keep_default_na=False, parse_dates=[0])
+        for df in frames:
             df.columns = [str(c).replace(" ", "_").replace("(","").replace(")","") for c in df.columns]
             cols = df.columns.tolist()
             # Format A
             if {"Direction","Coin","Futures","Transaction_amount","Average_Price","Fee"}.issubset(cols):
-                
-                for row in df.itertuples(index=False):
-                    d = row._asdict()
-                    dt = d["Date"]
-                    direction = d["Direction"].lower()
-                    coin = d["Coin"]
-                    pair = d["Futures"]
-                    amt = _to_decimal(d["Transaction_amount"])
-                    price = _to_decimal(d["Average_Price"])
-                    fee  = _to_decimal(d["Fee"])
-
-                    base = coin
-                    base_currency = EQUIVALENCES.get(base, base)
-                    
-                    asset = Asset(name=pair.replace(base,""), ticker=pair.replace(base,""))
-                    unit_price = Money(amount=price, currency=base_currency)
-                    commission = Money(amount=fee, currency=base_currency)
-
-                    if "open" in direction:
-                        records.append(
-                            BuyOperation(
-                                asset=asset,
-                                unit_price=unit_price,
-                                quantity=amt,
-                                commission=commission,
-                                date=dt,
-                            )
-                        )
-                    elif "close" in direction or "liquidation" in direction:
-                        records.append(
-                            SellOperation(
-                                asset=asset,
-                                unit_price=unit_price,
-                                quantity=amt,
-                                commission=commission,
-                                date=dt,
-                            )
+                # classify once per column: opens are buys, closes/liquidations sells, the rest is skipped
+                direction = df["Direction"].str.lower()
+                is_buy = direction.str.contains("open", regex=False, na=False)
+                keep = is_buy | direction.str.contains("close|liquidation", na=False)
+                df, is_buy = df[keep], is_buy[keep]
+                base_currencies = df["Coin"].map(EQUIVALENCES).fillna(df["Coin"])
+                # Values are already typed by read_csv, so models are built without re-validation
+                for dt, buy, base, base_currency, pair, amt, price, fee in zip(
+                    df["Date"], is_buy, df["Coin"], base_currencies, df["Futures"],
+                    map(_to_decimal, df["Transaction_amount"]), map(_to_decimal, df["Average_Price"]),
+                    map(_to_decimal, df["Fee"]),
+                ):
+                    name = pair.replace(base, "")
+                    records.append(
+                        self._construct(
+                            BuyOperation if buy else SellOperation,
+                            asset=_asset(name, name),
+                            unit_price=self._construct(Money, amount=price, currency=base_currency),
+                            quantity=amt,
+                            commission=self._construct(Money, amount=fee, currency=base_currency),
+                            date=dt,
                         )
+                    )
 
             # Format B
             elif {"Trading_pair","Direction","Price","Amount","Fee"}.issubset(cols):
-                for row in df.itertuples(index=False):
-                    d = row._asdict()
-                    dt = d["Date"]
-                    pair = d["Trading_pair"]
-                    direction = d["Direction"].lower()
-                    price = _to_decimal(d["Price"])
-                    amt   = _to_decimal(d["Amount"])
-                    fee   = _to_decimal(d["Fee"])
-
-                    # Handle currency equivalences
-                    if "/" in pair:
-                        base, quote = pair.split("/", 1)
-                    else:
-                        base, quote = pair[:3], pair[3:]
-                    
-                    quote_currency = EQUIVALENCES.get(quote, quote)
-
-                    asset = Asset(name=base, ticker=base)
-                    unit_price = Money(amount=price, currency=quote_currency)
-                    commission = Money(amount=fee, currency=quote_currency)
-
-                    if direction == "buy":
-                        records.append(
-                            BuyOperation(
-                                asset=asset,
-                                unit_price=unit_price,
-                                quantity=amt,
-                                commission=commission,
-                                date=dt,
-                            )
-                        )
-                    elif direction == "sell":
-                        records.append(
-                            SellOperation(
-                                asset=asset,
-                                unit_price=unit_price,
-                                quantity=amt,
-                                commission=commission,
-                                date=dt,
-                            )
+                direction = df["Direction"].str.lower()
+                is_buy = direction.eq("buy")
+                keep = is_buy | direction.eq("sell")
+                df, is_buy = df[keep], is_buy[keep]
+                # "ETH/USDT" splits on the slash, "ETHUSDT" after a 3-letter base;
+                # then currency equivalences, all per column
+                pair = df["Trading_pair"]
+                halves = pair.str.split("/", n=1)
+                has_slash = pair.str.contains("/", regex=False)
+                bases = halves.str[0].where(has_slash, pair.str[:3])
+                quotes = halves.str[1].where(has_slash, pair.str[3:])
+                quote_currencies = quotes.map(EQUIVALENCES).fillna(quotes)
+                for dt, buy, base, quote_currency, price, amt, fee in zip(
+                    df["Date"], is_buy, bases, quote_currencies,
+                    map(_to_decimal, df["Price"]), map(_to_decimal, df["Amount"]), map(_to_decimal, df["Fee"]),
+                ):
+                    records.append(
+                        self._construct(
+                            BuyOperation if buy else SellOperation,
+                            asset=_asset(base, base),
+                            unit_price=self._construct(Money, amount=price, currency=quote_currency),
+                            quantity=amt,
+                            commission=self._construct(Money, amount=fee, currency=quote_currency),
+                            date=dt,
                         )
+                    )
 
             # else: skip unknown
 
-        df_out = pd.DataFrame([r.model_dump() for r in records])
-        df_out["__object__"] = records
-        return df_out
+        return ParserResult(records)
 
@@ -1,10 +1,8 @@
 from __future__ import annotations
 from pathlib import Path
-from decimal import Decimal
 from datetime import datetime
-import pandas as pd
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _dec, _read_frames
 from ..models import (
     ManualInterestParserConfig,
     Interest, Money, FinOp,
@@ -21,38 +19,40 @@ class ManualInterestParser(AbstractParser):
     def __init__(self, config: ManualInterestParserConfig):
         super().__init__(config)
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         records: list[FinOp] = []
         path = Path(self.config.path)
         files = [path] if path.is_file() else list(path.glob(self.config.glob))
 
-        for f in files:
-            df = pd.read_csv(
-                f,
-                sep=self.config.sep,
-                encoding=self.config.encoding,
-                dtype=str,
-                skip_blank_lines=True,
-            )
+        frames = _read_frames(
+            files,
+            sep=self.config.sep,
+            encoding=self.config.encoding,
+            dtype=str,
+            keep_default_na=False,
+            skip_blank_lines=True,
+        )
+        for df in frames:
             for row in df.itertuples(index=False):
                 try:
                     year = int(getattr(row, 'year'))
-                    qty = Decimal(str(getattr(row, 'quantity')))
+                    raw_qty = getattr(row, 'quantity')
                     currency = getattr(row, 'currency')
-                    tax_amt = Decimal(str(getattr(row, 'tax')))
+                    raw_tax = getattr(row, 'tax')
                     source = getattr(row, 'source')
                 except Exception:
                     continue
+                # once the year parses it is a data row: a blank amount is an error, not a skip
+                qty, tax_amt = _dec(raw_qty), _dec(raw_tax)
                 date = datetime(year, 1, 1)
                 # Gross interest
                 records.append(
-                    Interest(
-                        gross=Money(amount=qty, currency=currency),
-                        tax=Money(amount=tax_amt, currency=currency),
+                    self._construct(
+                        Interest,
+                        gross=self._construct(Money, amount=qty, currency=currency),
+                        tax=self._construct(Money, amount=tax_amt, currency=currency),
                         date=date,
                         source=source,
                     )
                 )
-        df_out = pd.DataFrame([r.model_dump() for r in records])
-        df_out['__object__'] = records
-        return df_out
+        return ParserResult(records)
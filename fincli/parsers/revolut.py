@@ -1,11 +1,11 @@
 from __future__ import annotations
-from collections import defaultdict
+import re
 from pathlib import Path
-from datetime import datetime
 from decimal import Decimal
+
 import pandas as pd
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _dec, _read_frames
 from ..models import (
     RevolutParserConfig,
     Interest, Money, FinOp,
@@ -17,17 +17,23 @@ _SPANISH_MONTHS = {
     'mayo': 5, 'jun': 6, 'jul': 7, 'ago': 8,
     'sept': 9, 'oct': 10, 'nov': 11, 'dic': 12,
 }
+_SPANISH_MONTH_RE = re.compile(r"\b(" + "|".join(_SPANISH_MONTHS) + r")\b", re.IGNORECASE)
 
-def _parse_spanish_datetime(s: str) -> datetime:
-    # s like '31 dic 2024, 1:29:07'
-    date_part, time_part = s.split(',', 1)
-    day, mon_str, year = date_part.strip().split()
-    mon = _SPANISH_MONTHS[mon_str.lower()]
-    hour, minute, second = time_part.strip().split(':')
-    return datetime(
-        year=int(year), month=mon, day=int(day),
-        hour=int(hour), minute=int(minute), second=int(second)
+def _parse_spanish_datetimes(raw: pd.Series) -> pd.Series:
+    """'31 dic 2024, 1:29:07' → Timestamp, for a whole column; NaT where unparseable."""
+    # month names become numbers so the format does not depend on the process locale
+    numeric = (
+        raw.str.strip()
+        .str.replace(r"\s+", " ", regex=True)
+        .str.replace(_SPANISH_MONTH_RE, lambda m: str(_SPANISH_MONTHS[m.group().lower()]), regex=True)
     )
+    return pd.to_datetime(numeric, format="%d %m %Y, %H:%M:%S", errors="coerce")
+
+def _to_decimal(raw: str) -> Decimal | None:
+    try:
+        return _dec(raw) # blank, unparseable and NaN cells alike are dropped
+    except Exception:
+        return None
 
 class RevolutParser(AbstractParser):
     """
@@ -40,66 +46,55 @@ class RevolutParser(AbstractParser):
     def __init__(self, config: RevolutParserConfig):
         super().__init__(config)
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         path = Path(self.config.path)
         files = [path] if path.is_file() else list(path.glob(self.config.glob))
 
-        # temp store: key -> dict with date, gross, tax
-        grouped = defaultdict(lambda: [])
-
-        for f in files:
-            text = f.read_text(encoding=self.config.encoding)
-            for line in text.splitlines()[1:]:
-                if not line.strip():
-                    continue
-                parts = line.split(self.config.sep)
-                raw_date = parts[0]
-                desc     = parts[1]
-                raw_value= parts[2].replace(',', '.').strip()
-                try:
-                    dt  = _parse_spanish_datetime(raw_date)
-                    val = Decimal(raw_value)
-                except Exception:
-                    continue
+        frames = _read_frames(
+            files,
+            sep=self.config.sep,
+            encoding=self.config.encoding,
+            header=0,
+            usecols=[0, 1, 2],
+            names=["Date", "Description", "Value"], # same columns whatever the export's header says
+            dtype=str,
+            na_filter=False,
+        )
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["Date", "Description", "Value"], dtype=str)
 
-                # Determine key: use description without trailing ' Tax'
-                # key_desc = desc.replace(" Tax", "").strip()
-                entry = grouped[str(dt)]
-                # entry = grouped[key_desc]
-                # record date from the non-tax line (first occurrence)
+        # dates and decimal commas are handled for all rows at once; rows where either
+        # does not parse are dropped
+        df["date"] = _parse_spanish_datetimes(df["Date"])
+        df["val"] = [_to_decimal(v) for v in df["Value"].str.replace(",", ".", regex=False).str.strip()]
+        df = df.dropna(subset=["date", "val"])
 
-                entry.append({
-                    "source": desc,
-                    "val": val,
-                })
-
-              
+        # Lines sharing a timestamp belong to one payout. Each line adds to every bucket its
+        # description matches (independent tests, not an elif chain).
+        desc = df["Description"]
+        zero = Decimal(0)
+        df["gross"] = df["val"].where(desc.str.contains("Interest PAID", regex=False), zero)
+        df["tax"] = df["val"].where(desc.str.contains("Tax", regex=False), zero)
+        df["fee"] = df["val"].where(desc.str.contains("Fee", regex=False), zero)
+        df["movement"] = desc.str.contains("WITHDRAWN|Reinvested|BUY EUR|SELL EUR")
+        grouped = df.groupby("date", sort=False).agg(
+            gross=("gross", "sum"), tax=("tax", "sum"), fee=("fee", "sum"),
+            lines=("val", "size"), movement=("movement", "first"),
+        )
+        # a lone withdrawal / reinvestment / fund trade is a cash movement, not income
+        grouped = grouped[~(grouped["lines"].eq(1) & grouped["movement"])]
 
         # build model instances
         records: list[FinOp] = []
-        for date, vals in grouped.items():
-            
-            if len(vals) == 1 and ("WITHDRAWN" in vals[0]["source"] or "Reinvested" in vals[0]["source"] or "BUY EUR" in vals[0]["source"] or "SELL EUR" in vals[0]["source"]):
-                continue
-
-            if len(vals)!=2 and not "Interest PAID" in vals[0]["source"] :
-                pass
-            gross = sum(map(lambda x: x["val"] if "Interest PAID" in x["source"] else 0, vals))
-            tax = sum(map(lambda x: x["val"] if "Tax" in x["source"] else 0, vals))
-            fee = sum(map(lambda x: x["val"] if "Fee" in x["source"] else 0, vals))
-            net = gross - fee
-            
+        for row in grouped.itertuples():
             records.append(
-                Interest(
-                    gross=Money(amount=net, currency="EUR"),
-                    tax=Money(amount=tax, currency="EUR"),
-                    commission=Money(amount=fee, currency="EUR"),
-                    date=date,
+                self._construct(
+                    Interest,
+                    gross=self._construct(Money, amount=row.gross - row.fee, currency="EUR"),
+                    tax=self._construct(Money, amount=row.tax, currency="EUR"),
+                    commission=self._construct(Money, amount=row.fee, currency="EUR"),
+                    date=row.Index,
                     source="Revolut Savings"
                 )
             )
 
-        # assemble DataFrame
-        df_out = pd.DataFrame([r.model_dump() for r in records])
-        df_out["__object__"] = records
-        return df_out
\ No newline at end of file
+        return ParserResult(records)
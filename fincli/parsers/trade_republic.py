@@ -6,11 +6,16 @@ import pandas as pd
 from pydantic import BaseModel
 
 from ..models import (
-    Asset, Money,
+    Money,
     BuyOperation, SellOperation, Dividend, Interest,
     FinOp, TRParserConfig,
 )
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _asset, _dec, _read_frames
+
+# The only "Tipo" values that become records; anything else reads as NaN
+_KINDS = pd.CategoricalDtype(["Compra", "Venta", "Dividendo", "Intereses"])
+_BUY, _SELL, _DIVIDEND, _INTEREST = range(len(_KINDS.categories)) # category codes
+_COLUMNS = {"Fecha", "Tipo", "Valor", "Nota", "ISIN", "Cantidad", "Comisiones"}
 
 class TradeRepublicParser(AbstractParser):
     config_model = TRParserConfig
@@ -18,74 +23,83 @@ class TradeRepublicParser(AbstractParser):
     def __init__(self, config: TRParserConfig):
         super().__init__(config)
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         """Parse *all* CSVs inside `data_dir` into a canonical dataframe."""
-        frames: list[pd.DataFrame] = []
         path = Path(self.config.data_dir)
-        for csv in path.glob(self.config.csv_glob):
-            frames.append(
-                pd.read_csv(
-                    csv,
-                    sep=self.config.sep,
-                    encoding=self.config.encoding,
-                    parse_dates=["Fecha"],
-                    dayfirst=False,
-                )
-            )
+        frames = _read_frames(
+            list(path.glob(self.config.csv_glob)),
+            sep=self.config.sep,
+            encoding=self.config.encoding,
+            parse_dates=["Fecha"],
+            dayfirst=False,
+            keep_default_na=False, # blank cells stay "" (never NaN) for the defaults below
+            usecols=lambda col: col in _COLUMNS, # callable: older exports lack Comisiones
+            dtype={
+                "Tipo": _KINDS,
+                "Valor": str, "Cantidad": str, "Comisiones": str, # Decimal straight from the export text
+                "Nota": str, "ISIN": str,
+            },
+        )
+        # no copy=False: under Copy-on-Write (pandas 3) concat already avoids eager copies
         raw = pd.concat(frames, ignore_index=True)
 
         # Map raw -> strongly-typed rows (dicts) – keeps processors clean
         records: list[FinOp] = []
-        for _, row in raw.iterrows():
-            kind = row["Tipo"]
-            date = row["Fecha"]
-            amount = Decimal(str(row["Valor"]))  # TR uses decimal '.' but negative for outflow
-            note = str(row["Nota"]).strip() if pd.notna(row["Nota"]) else "Undefined"
-            isin = str(row["ISIN"]) if pd.notna(row["ISIN"]) else None
-            quantity = Decimal("1") if pd.isna(row["Cantidad"]) else Decimal(str(row["Cantidad"]))
-            comission = Decimal("0") if pd.isna(row.get("Comisiones", 0)) else abs(Decimal(str(row.get("Comisiones", 0))))
+        if "Comisiones" not in raw.columns: # older exports have no fee column
+            raw["Comisiones"] = "0"
+        # Column-wise preparation: only the kinds we map, NaN defaults filled, and every
+        # amount converted to Decimal in one pass per column.
+        raw = raw[raw["Tipo"].notna()]
+        # TR uses decimal '.' but negative for outflow; all records carry the magnitude
+        amounts = [abs(_dec(v)) for v in raw["Valor"]]
+        quantities = [_dec(q, Decimal("1")) for q in raw["Cantidad"]]
+        comissions = [abs(_dec(c, Decimal("0"))) for c in raw["Comisiones"]]
+        notes = [n.strip() if n else "Undefined" for n in raw["Nota"]]
+        isins = [i if i else None for i in raw["ISIN"]]
 
-            if kind == "Compra":
+        for kind, date, amount, note, isin, quantity, comission in zip(
+            raw["Tipo"].cat.codes, raw["Fecha"], amounts, notes, isins, quantities, comissions,
+        ):
+            if kind == _BUY:
                 records.append(
-                    BuyOperation(
-                        asset=Asset(name=note, isin=isin),
-                        unit_price=Money(amount=abs(amount)/quantity, currency="EUR"),
+                    self._construct(
+                        BuyOperation,
+                        asset=_asset(note, isin=isin),
+                        unit_price=self._construct(Money, amount=amount/quantity, currency="EUR"),
                         quantity=quantity,
-                        commission=Money(amount=comission, currency="EUR"),
+                        commission=self._construct(Money, amount=comission, currency="EUR"),
                         date=date,
                     )
                 )
-            elif kind == "Venta":
+            elif kind == _SELL:
                 records.append(
-                    SellOperation(
-                        asset=Asset(name=note, isin=isin),
-                        unit_price=Money(amount=abs(amount)/quantity, currency="EUR"),
-                        quantity=Decimal("1") if pd.isna(row["Cantidad"]) else Decimal(str(row["Cantidad"])),
-                        commission=Money(amount=comission, currency="EUR"),
+                    self._construct(
+                        SellOperation,
+                        asset=_asset(note, isin=isin),
+                        unit_price=self._construct(Money, amount=amount/quantity, currency="EUR"),
+                        quantity=quantity,
+                        commission=self._construct(Money, amount=comission, currency="EUR"),
                         date=date,
                     )
                 )
-            elif kind == "Dividendo":
+            elif kind == _DIVIDEND:
                 records.append(
-                    Dividend(
-                        asset=Asset(name=note, isin=isin),
-                        gross=Money(amount=abs(amount), currency="EUR"),
+                    self._construct(
+                        Dividend,
+                        asset=_asset(note, isin=isin),
+                        gross=self._construct(Money, amount=amount, currency="EUR"),
                         date=date,
                         source="TR"
                     )
                 )
-            elif kind == "Intereses":
+            elif kind == _INTEREST:
                 records.append(
-                    Interest(
-                        gross=Money(amount=abs(amount), currency="EUR"),
+                    self._construct(
+                        Interest,
+                        gross=self._construct(Money, amount=amount, currency="EUR"),
                         date=date,
                         source="TR"
                     )
                 )
-            else:  # silently ignore unknowns, or raise
-                continue
 
-        # One row per FinOp
-        df = pd.DataFrame([r.model_dump() for r in records])
-        df["__object__"] = records  # keep native object version beside flat cols
-        return df
\ No newline at end of file
+        return ParserResult(records)
\ No newline at end of file
@@ -1,79 +1,65 @@
 from __future__ import annotations
+import csv
 from collections import defaultdict
 from pathlib import Path
 from decimal import Decimal
-from datetime import datetime
 from typing import Any, Dict, List
+import numpy as np
 import pandas as pd
 
-from .abstract import AbstractParser
+from .abstract import AbstractParser, ParserResult, _asset, _dec as _plain_dec
 from ..models import (
     XTBParserConfig,
-    Asset, Money,
-    BuyOperation, SellOperation, Dividend, Interest, AssetTrade, FinOp, ZERO_EUR
+    Money,
+    BuyOperation, SellOperation, Dividend, Interest, FinOp, ZERO_EUR
 )
 
 # Helpers --------------------------------------------------------------------
+_DEC_TABLE = str.maketrans({".": "", ",": "."})
+_ZERO = Decimal(0)
+
 def _dec(euro_str: str) -> Decimal:
     """'1.234,56' or '0,6'  →  Decimal('1234.56') / Decimal('0.6')"""
-    return Decimal(euro_str.replace(".", "").replace(",", "."))
-
-def _parse_dt(date_str: str, fmt: str) -> datetime:
-    return datetime.strptime(date_str, fmt)
+    if not euro_str or euro_str == "0": # the optional-column defaults
+        return _ZERO
+    return _plain_dec(euro_str.translate(_DEC_TABLE))
 
 
-def group_within_threshold(lines, threshold_seconds=10, sep=";"):
+def group_within_threshold(rows, threshold_seconds=10):
     """
-    Iterate over (timestamp‐sorted) lines and assign a “group key” such 
-    that any two consecutive entries within threshold_seconds land in the same group.
+    Iterate over (timestamp‐sorted) rows, already split into fields (e.g. by csv.reader),
+    and split them into consecutive groups such that any two consecutive entries within
+    threshold_seconds land in the same group.
+    Each entry carries its own "dt"; a group's date is its first entry's.
     """
 
-    # First, parse everything (and sort by dt upfront)
-    parsed = []
-    for line in lines:
-        parts = line.split(sep)
-        _, typ, raw_time, comment, symbol, raw_amount, *_ = parts
-        dt = datetime.strptime(raw_time, "%d/%m/%Y %H:%M:%S")
-        parsed.append((dt, typ.strip(), comment.strip(), symbol.strip(), _dec(raw_amount.strip())))
-    parsed.sort(key=lambda tup: tup[0])
-
-    grouped = {}
-    if not parsed:
-        return grouped
-
-    # Use the first dt as the “anchor” for group 1
-    current_group_key = parsed[0][0]  # you could also store an integer index
-    grouped[current_group_key] = [{
-        "type": parsed[0][1],
-        "amount": parsed[0][4],
-        "desc": parsed[0][2],
-        "symbol": parsed[0][3],
-    }]
-
-    last_dt = parsed[0][0]
-
-    for dt, typ, comment, symbol, amount in parsed[1:]:
-        # If this entry is ≤ threshold_seconds away from the LAST entry, 
-        # put it in the same group; otherwise start a new group.
-        if (dt - last_dt).total_seconds() <= threshold_seconds:
-            grouped[current_group_key].append({
-                "type": typ,
-                "amount": amount,
-                "desc": comment,
-                "symbol": symbol,
-            })
+    # First, parse everything (and sort by dt upfront); timestamps are parsed as one column
+    rows = list(rows)
+    times = pd.to_datetime([row[2] for row in rows], format="%d/%m/%Y %H:%M:%S")
+    stamps = times.as_unit("ns").asi8
+    order = np.argsort(stamps, kind="stable")
+
+    # Group boundaries fall where the gap to the previous entry exceeds the threshold,
+    # found with one diff over the sorted int64 nanosecond stamps
+    gaps = np.diff(stamps[order])
+    starts = set((np.flatnonzero(gaps > threshold_seconds * 1_000_000_000) + 1).tolist())
+
+    groups: list[list[dict]] = []
+    for pos, (i, dt) in enumerate(zip(order.tolist(), times[order].to_pydatetime())):
+        _, typ, _raw_time, comment, symbol, raw_amount, *_ = rows[i]
+        entry = {
+            "dt": dt,
+            "type": typ.strip(),
+            "amount": _dec(raw_amount.strip()),
+            "desc": comment.strip(),
+            "symbol": symbol.strip(),
+        }
+        if pos == 0 or pos in starts:
+            groups.append([entry])
         else:
-            # start a fresh group anchored at this dt
-            current_group_key = dt
-            grouped[current_group_key] = [{
-                "type": typ,
-                "amount": amount,
-                "desc": comment,
-                "symbol": symbol,
-            }]
-        last_dt = dt
-
-    return grouped
+            groups[-1].append(entry)
+
+    return groups
 
 class XTBParser(AbstractParser):
     """Parses XTB cashOperations & tradeOperations CSVs."""
@@ -90,78 +76,66 @@ class XTBParser(AbstractParser):
         Parse XTB cashOperations.csv, grouping “Free-funds Interest” and their matching
         “Free-funds Interest Tax” rows into single Interest records, and any Dividend entries.
         """
-        # Read all lines
-        text = file.read_text(encoding=self.config.encoding)
-        lines = [line for line in text.splitlines() if line.strip()]
-        # Skip header
-        data_lines = lines[1:]
-
-        # Temporary grouping: key by (date)
-        grouped = group_within_threshold(data_lines, threshold_seconds=10, sep=self.config.sep)
-
-            
+        # Stream the rows (csv.reader also honours quoted fields), skipping blank lines
+        with file.open(encoding=self.config.encoding, newline="") as fh:
+            rows = (r for r in csv.reader(fh, delimiter=self.config.sep) if any(f.strip() for f in r))
+            next(rows, None) # Skip header
+            # Temporary grouping: runs of entries a few seconds apart
+            groups = group_within_threshold(rows, threshold_seconds=10)
 
         # Build FinOp records
         records: list[FinOp] = []
-        types_set = {
-            y["type"]
-            for x in grouped.values()
-            for y in x
-        }
         Interest_types = {"Free-funds Interest", "Free-funds Interest Tax"}
         Dividend_types = {"DIVIDENT", "Withholding Tax"}
         Important_types = Interest_types | Dividend_types
-        # print(types_set)
-        for date, entry_list in grouped.items():
+        for entry_list in groups:
+            date = entry_list[0]["dt"]
+            # Bucket the group by type once instead of rescanning it per sum
+            by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for x in entry_list:
+                by_type[x["type"]].append(x)
+
             # 1) Skip if there are no interest/dividend entries at all
-            if all(x["type"] not in Important_types for x in entry_list):
+            if by_type.keys().isdisjoint(Important_types):
                 continue
 
             # 2) First, handle Interest:
-            gross_interest = sum(
-                x["amount"] 
-                for x in entry_list 
-                if x["type"] in Interest_types and "Tax" not in x["type"]            )
-            tax_interest = abs(sum(
-                x["amount"] 
-                for x in entry_list 
-                if x["type"] in Interest_types and "Tax" in x["type"]
-            ))
+            gross_interest = sum((x["amount"] for x in by_type["Free-funds Interest"]), Decimal(0))
+            tax_interest = abs(sum((x["amount"] for x in by_type["Free-funds Interest Tax"]), Decimal(0)))
             if gross_interest > 0:
                 records.append(
-                    Interest(
-                        gross=Money(amount=gross_interest, currency="EUR"),
-                        tax=Money(amount=tax_interest, currency="EUR"),
+                    self._construct(
+                        Interest,
+                        gross=self._construct(Money, amount=gross_interest, currency="EUR"),
+                        tax=self._construct(Money, amount=tax_interest, currency="EUR"),
                         date=date,
                         source="XTB",
                     )
                 )
 
             # 3) Now build one Dividend instance per symbol on this date:
-            #    - collect all “dividend‐type” entries in a per‐symbol bucket
-            dividends_by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            #    - sum gross ("DIVIDENT") and tax ("Withholding Tax") per symbol, symbols
+            #      in order of first appearance
+            if by_type.keys().isdisjoint(Dividend_types):
+                continue
+            dividends_by_symbol: Dict[str, List[Decimal]] = {}
             for x in entry_list:
                 if x["type"] in Dividend_types:
-                    dividends_by_symbol[x["symbol"]].append(x)
-
-            # 4) For each symbol, sum gross and tax separately:
-            for symbol, div_entries in dividends_by_symbol.items():
-                # Sum gross dividend amounts for THIS symbol (exclude any "Tax" entries)
-                gross_div = sum(x["amount"] for x in div_entries if "Tax" not in x["type"])
-                # Sum tax entries for THIS symbol (any “Dividend‐type” where type contains "Tax")
-                tax_div = sum(x["amount"] for x in div_entries if "Tax" in x["type"])
+                    sums = dividends_by_symbol.setdefault(x["symbol"], [Decimal(0), Decimal(0)])
+                    sums["Tax" in x["type"]] += x["amount"]
 
+            # 4) For each symbol, emit its gross and tax:
+            for symbol, (gross_div, tax_div) in dividends_by_symbol.items():
                 if gross_div > 0:
-                    asset = Asset(
-                        name=symbol,      # you could substitute a lookup if you have a nicer name
-                        isin=None,        # XTB does not provide ISINs
-                        ticker=symbol     # symbol is the ticker in your existing code
-                    )
+                    # symbol is both name and ticker (you could substitute a lookup if you have
+                    # a nicer name); XTB cash operations carry no ISIN
+                    asset = _asset(symbol, symbol)
                     records.append(
-                        Dividend(
+                        self._construct(
+                            Dividend,
                             asset=asset,
-                            gross=Money(amount=gross_div, currency="EUR"),
-                            tax=Money(amount=tax_div, currency="EUR"),
+                            gross=self._construct(Money, amount=gross_div, currency="EUR"),
+                            tax=self._construct(Money, amount=tax_div, currency="EUR"),
                             date=date,
                             source="XTB",
                         )
@@ -170,119 +144,127 @@ class XTBParser(AbstractParser):
         return records
 
     # --------------------------------------------------------------------- #
-    # TRADE OPERATIONS  ->  AssetTrade (Buy + Sell bundled)
+    # TRADE OPERATIONS  ->  BuyOperation + SellOperation pairs
     # --------------------------------------------------------------------- #
     def _parse_trades(self, file: Path) -> list[FinOp]:
-        # Read raw lines
-        lines = file.read_text(encoding=self.config.encoding).splitlines()
-        if len(lines) < 3:
+        # Only the two header lines are read by hand; pandas parses the data rows
+        # straight from the file
+        with file.open(encoding=self.config.encoding) as f:
+            line1, line2, first_row = f.readline(), f.readline(), f.readline()
+        if not first_row: # no data row under the two header lines (or no headers at all)
             return []
-
-        # First two header lines
-        hdr1 = lines[0].split(self.config.sep)
-        hdr2 = lines[1].split(self.config.sep)
+        hdr1 = line1.rstrip("\r\n").split(self.config.sep)
+        hdr2 = line2.rstrip("\r\n").split(self.config.sep)
 
         # Build combined column names
         cols = []
+        seen: set[str] = set()
+        dupes: dict[str, int] = {}
         prev_c1 = ""
         for c1, c2 in zip(hdr1, hdr2):
             c1 = c1.strip()
             if len(c1) == 0:
                 c1 = prev_c1 
             c2 = c2.strip()
-            if c2:
-                cols.append(f"{c1}_{c2}")
-            else:
-                cols.append(c1)
+            col = f"{c1}_{c2}" if c2 else c1
+            # read_csv(names=...) rejects duplicates: number repeats as pandas does for a
+            # header row ("X", "X.1", ...)
+            if col in seen:
+                base = col
+                while col in seen:
+                    dupes[base] = dupes.get(base, 0) + 1
+                    col = f"{base}.{dupes[base]}"
+            seen.add(col)
+            cols.append(col)
             prev_c1 = c1
 
-        # The remainder lines → data
-        data_lines = lines[2:]
         df = pd.read_csv(
-            pd.io.common.StringIO("\n".join([";".join(cols)] + data_lines)),
+            file,
             sep=self.config.sep,
             encoding=self.config.encoding,
+            skiprows=2,
+            names=cols,
+            header=None,
+            dtype=str, # amounts keep their decimal commas for _dec
+            keep_default_na=False,
         )
         # Clean up DataFrame
-        # Remove empty rows
-        df = df.dropna(how='all')
+        # Remove empty rows (missing cells are "" rather than NaN)
+        df = df[df.ne("").any(axis=1)]
 
 
         df.columns = [c.strip().replace(" ","_").replace("(","").replace(")","") for c in df.columns]  # Clean column names
 
-        records: list[FinOp] = []
-        for row in df.itertuples(index=False):
-            t = row._asdict()
-            if all(map(pd.isna, t.values())):
-                continue
+        # both trade dates parsed per column rather than per row
+        for col in ("Compra_Fecha", "Venta_Fecha"):
+            df[col] = pd.to_datetime(df[col], format="%d/%m/%Y")
 
+        # cross-checking every row against XTB's own net result is opt-in
+        check_pnl = self.config.strict_pnl or self.validate
+        records: list[FinOp] = []
+        for row in df.itertuples(index=False): # blank rows were already removed above
             # Basic fields
-            name   = t["Nombre"]
-            isin   = t["ISIN"]
-            ticker = t["Ticker"]
-            vol    = _dec(t["Volumen"].replace(" ", ""))
+            name   = row.Nombre
+            isin   = row.ISIN
+            ticker = row.Ticker
+            vol    = _dec(row.Volumen.replace(" ", ""))
 
             # Buy side fields
-            buy_dt    = _parse_dt(t["Compra_Fecha"], "%d/%m/%Y")
-            buy_amt   = _dec(t["Compra_Importe_transacción_EUR"])
+            buy_dt    = row.Compra_Fecha
+            buy_amt   = _dec(row.Compra_Importe_transacción_EUR)
             unit_buy  = buy_amt / vol if vol else Decimal(0)
 
             # Sell side fields
-            sell_dt   = _parse_dt(t["Venta_Fecha"], "%d/%m/%Y")
-            sell_amt  = _dec(t["Venta_Importe_transacción_EUR"])
+            sell_dt   = row.Venta_Fecha
+            sell_amt  = _dec(row.Venta_Importe_transacción_EUR)
             unit_sell = sell_amt / vol if vol else Decimal(0)
 
-            # Tax & commissions
-            comm = _dec(t.get("Comisión_transacción__EUR", "0"))
-            rollover = _dec(t.get("Rollovers_EUR", "0"))
-            swaps = _dec(t.get("Swaps_EUR", "0"))
+            # Tax & commissions (optional columns)
+            comm = _dec(getattr(row, "Comisión_transacción__EUR", "") or "0")
+            rollover = _dec(getattr(row, "Rollovers_EUR", "") or "0")
+            swaps = _dec(getattr(row, "Swaps_EUR", "") or "0")
 
             total_comm = comm + abs(rollover) + abs(swaps)
 
-            tax  = _dec(t.get("Impuesto_sobre_transacciones_financieras_o_similares_EUR", "0"))
-            operation_direction = t.get("Posición", "Alcista").strip()
+            tax  = _dec(getattr(row, "Impuesto_sobre_transacciones_financieras_o_similares_EUR", "") or "0")
+            operation_direction = (getattr(row, "Posición", "") or "Alcista").strip()
             if operation_direction == "Bajista":
                 # We swap dates for compatibility with existing code
                 # (where buy_dt is always before sell_dt)
                 buy_dt, sell_dt = sell_dt, buy_dt
             # Build ops
-            buy_op = BuyOperation(
-                asset=Asset(name=name, isin=isin if not pd.isna(isin) else None, ticker=ticker),
-                unit_price=Money(amount=unit_buy, currency="EUR"),
+            buy_op = self._construct(
+                BuyOperation,
+                asset=_asset(name, ticker, isin or None),
+                unit_price=self._construct(Money, amount=unit_buy, currency="EUR"),
                 quantity=vol,
                 commission=ZERO_EUR,
-                tax=ZERO_EUR,
                 date=buy_dt
             )
-            sell_op = SellOperation(
+            sell_op = self._construct(
+                SellOperation,
                 asset=buy_op.asset,
-                unit_price=Money(amount=unit_sell, currency="EUR"),
+                unit_price=self._construct(Money, amount=unit_sell, currency="EUR"),
                 quantity=vol,
-                commission=Money(amount=total_comm, currency="EUR"),
-                tax=Money(amount=tax, currency="EUR"),
+                commission=self._construct(Money, amount=total_comm, currency="EUR"),
+                tax=self._construct(Money, amount=tax, currency="EUR"),
                 date=sell_dt
             )
 
-            pnl = _dec(t["Resultado_neto_EUR"])
-            if abs(pnl-(sell_op.unit_price.amount*sell_op.quantity-buy_op.unit_price.amount*buy_op.quantity - total_comm))> 0.01:
-                raise ValueError(f"Unexpected PnL: {pnl} != {sell_op.unit_price.amount*vol - buy_op.unit_price.amount*vol}") 
-            records +=[
-                buy_op, sell_op
-            ]
-            # records.append(
-            #     AssetTrade(buy=buy_op, sell=sell_op, pnl=Money(amount=pnl, currency="EUR"), tax=sell_op.tax)
-            # )
+            if check_pnl:
+                pnl = _dec(row.Resultado_neto_EUR)
+                if abs(pnl-(sell_op.unit_price.amount*sell_op.quantity-buy_op.unit_price.amount*buy_op.quantity - total_comm))> 0.01:
+                    raise ValueError(f"Unexpected PnL: {pnl} != {sell_op.unit_price.amount*vol - buy_op.unit_price.amount*vol}") 
+            records.append(buy_op)
+            records.append(sell_op)
 
         return records
 
     # --------------------------------------------------------------------- #
     # public API
     # --------------------------------------------------------------------- #
-    def load(self) -> pd.DataFrame:
+    def load(self) -> ParserResult:
         cash_recs   = self._parse_cash(Path(self.config.cash_file))
         trade_recs  = self._parse_trades(Path(self.config.trades_file))
 
-        records = cash_recs + trade_recs
-        df = pd.DataFrame([r.model_dump() for r in records])
-        df["__object__"] = records
-        return df
\ No newline at end of file
+        return ParserResult(cash_recs + trade_recs)
\ No newline at end of file
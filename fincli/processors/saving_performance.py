@@ -1,4 +1,5 @@
 from decimal import Decimal
+from operator import attrgetter
 
 from ..models import (
     FinOp, SavingPerformanceIn, SavingPerformanceOut,
@@ -19,19 +20,15 @@ class SavingPerformanceProcessor(AbstractProcessor):
         self.year = year
 
     def process(self, data: SavingPerformanceIn) -> SavingPerformanceOut:
-        total_eur = Decimal("0")
-        recs: list[FinOp] = []
-
-        for op in data.operations:
-            if isinstance(op, Dividend) and op.date.year == self.year:
-                total_eur += op.gross.amount
-                recs.append(op)
-            elif isinstance(op, Interest) and op.date.year == self.year:
-                total_eur += op.gross.amount
-                recs.append(op)
+        year = self.year
+        recs: list[FinOp] = [
+            op for op in data.operations
+            if isinstance(op, (Dividend, Interest)) and op.date.year == year
+        ]
+        total_eur = sum((op.gross.amount for op in recs), Decimal("0"))
 
         return SavingPerformanceOut(
             year=self.year,
             total_eur=total_eur,
-            records=sorted(recs, key=lambda x: x.date),
+            records=sorted(recs, key=attrgetter("date")),
         )
\ No newline at end of file
@@ -1,7 +1,9 @@
+import os
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from decimal import Decimal
-
-import pandas as pd
+from operator import attrgetter
 
 from ..models import (
     Asset, TradingPerformanceIn, TradingPerformanceOut,
@@ -10,6 +12,93 @@ from ..models import (
 )
 from .abstract import AbstractProcessor
 
+
+@dataclass(slots=True)
+class _PNLAcc:
+    """Plain per-asset accumulator; turned into an AssetPNL once the FIFO pass is done."""
+    asset: Asset | None = None
+    pnl: Decimal = Decimal(0)
+    trades: list[AssetTrade] = field(default_factory=list)
+    total_buy_eur: Decimal = Decimal(0)
+    total_sell_eur: Decimal = Decimal(0)
+    matched_qty: Decimal = Decimal(0)
+
+
+# operation count from which assets are matched in parallel worker processes
+_PARALLEL_MIN_OPS = 50_000
+
+
+def _match_asset(ops: list) -> tuple[_PNLAcc | None, deque[list]]:
+    """FIFO-match one asset's chronological buys and sells.
+
+    Returns the P/L accumulator (None when nothing was sold) and the queue of
+    still-open lots as [lot, remaining qty]. Module-level so a process pool can
+    pickle it.
+    """
+    lots: deque[list] = deque()
+    add_lot, pop_lot = lots.append, lots.popleft
+    pnl_record = None
+    for op in ops:
+        if isinstance(op, BuyOperation):
+            add_lot([op, op.quantity])
+            continue
+
+        # sell-side values are fixed for the whole match: read them once
+        comission = op.commission.amount if op.commission else Decimal(0)
+        sell_px = op.unit_price.amount
+
+        qty_to_match = op.quantity
+        sell_pnl = Decimal(0)
+            
+        if pnl_record is None:
+            # First sell of the year for this asset
+            pnl_record = _PNLAcc(asset=op.asset)
+            add_trade = pnl_record.trades.append
+        # running totals as locals, written back after the match (same addition order)
+        total_buy_eur = pnl_record.total_buy_eur
+        total_sell_eur = pnl_record.total_sell_eur
+        matched_qty = pnl_record.matched_qty
+
+        while qty_to_match > 0:
+            try:
+                lot = lots[0]
+            except IndexError: # no open lots left
+                break
+            buy_lot, remaining = lot
+            match_qty = min(qty_to_match, remaining)
+
+            buy_px = buy_lot.unit_price.amount
+            pnl_amount = (sell_px - buy_px) * match_qty - comission
+
+            # Register the trade (both legs are already-built FinOps and the P/L is
+            # a Decimal in EUR, so nothing here needs validating)
+            add_trade(AssetTrade.model_construct(
+                buy=buy_lot,
+                sell=op,
+                pnl=Money.model_construct(amount=pnl_amount, currency="EUR"),
+            ))
+            sell_pnl += pnl_amount
+
+
+            # **accumulate gross buy/sell**
+            total_buy_eur += buy_px * match_qty
+            total_sell_eur += sell_px * match_qty
+            matched_qty += match_qty
+
+            # Update remaining quantities
+            lot[1] = remaining - match_qty
+            qty_to_match -= match_qty
+            if lot[1] == 0:
+                pop_lot()
+
+        pnl_record.pnl += sell_pnl
+        pnl_record.total_buy_eur = total_buy_eur
+        pnl_record.total_sell_eur = total_sell_eur
+        pnl_record.matched_qty = matched_qty
+
+    return pnl_record, lots
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Trading performance (FIFO net P/L per asset)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -17,113 +106,89 @@ class TradingPerformanceProcessor(AbstractProcessor):
     input_model = TradingPerformanceIn
     output_model = TradingPerformanceOut
 
-    def __init__(self, year: int):
+    def __init__(self, year: int, verbose: bool = False):
         self.year = year
+        # print the per-ticker open-position summary while processing
+        self.verbose = verbose
 
     def process(self, data: TradingPerformanceIn) -> TradingPerformanceOut:
-        # Buckets per asset: queue of unmatched BUY lots
-        buys: dict[str, deque[BuyOperation]] = defaultdict(deque)
-        # Map asset_key -> AssetPNL
-        output: dict[str, AssetPNL] = defaultdict(
-            lambda: AssetPNL(
-                asset=Asset(name="Undefined", isin="UN0000000000", ticker="UN0000000000"),
-                pnl=Money(amount=Decimal(0), currency="EUR"),
-                trades=[],
-                total_buy_eur=Decimal(0),
-                total_sell_eur=Decimal(0),
-            )
-        )
+        # Buckets per asset: queue of unmatched BUY lots as [lot, remaining qty]
+        # (FinOps are shared with the raw results, so they are never mutated here)
+        # Both are filled once per asset below, so plain dicts: no factory fires on lookups
+        buys: dict[str, deque[list]] = {}
+        # Map asset_key -> running totals (only assets sold this year get one)
+        output: dict[str, _PNLAcc] = {}
 
         
 
-        # Stream operations chronologically
-        sorted_ops = sorted(data.operations, key=lambda o: (o.date, o.class__))
-        for op in sorted_ops:
+        # Split operations per asset in one pass (chronological within each asset): FIFO
+        # matching never crosses assets, so each history is then walked on its own.
+        # first_sell remembers when an asset's first sell of the year comes, which is
+        # the order the summary lists assets in.
+        by_asset: dict[str, list] = defaultdict(list)
+        first_sell: dict[str, int] = {}
+        year = self.year
+        # Only buys (any year) and this year's sells take part, so the rest is dropped
+        # before sorting. class__ is the models' discriminator field: on equal dates
+        # "BuyOperation" < "SellOperation" puts buys first.
+        trade_ops = [
+            op for op in data.operations
+            if isinstance(op, BuyOperation) or (isinstance(op, SellOperation) and op.date.year == year)
+        ]
+        sorted_ops = sorted(trade_ops, key=attrgetter("date", "class__"))
+        for i, op in enumerate(sorted_ops):
             if isinstance(op, BuyOperation):
-                key = op.asset.isin or op.asset.name
-                buys[key].append(op)
-
-            elif isinstance(op, SellOperation) and op.date.year == self.year:
-                asset_key = op.asset.isin or op.asset.name
-                comission = op.commission.amount if op.commission else Decimal(0)
-
-                qty_to_match = op.quantity
-                
-                # Ensure we have an entry for this key
-                pnl_record = output[asset_key]
-                if pnl_record.asset.isin == "UN0000000000":
-                    # First time encountering this asset_key
-                    pnl_record.asset = op.asset
-
-                while qty_to_match > 0 and buys[asset_key]:
-                    buy_lot = buys[asset_key][0]
-                    match_qty = min(qty_to_match, buy_lot.quantity)
-
-                    buy_px = buy_lot.unit_price.amount
-                    sell_px = op.unit_price.amount
-                    pnl_amount = (sell_px - buy_px) * match_qty - comission
-
-                    trade = AssetTrade(
-                        buy=buy_lot,
-                        sell=op,
-                        pnl=Money(amount=pnl_amount, currency="EUR"),
-                    )
-
-                    # Register the trade
-                    pnl_record.trades.append(trade)
-                    pnl_record.pnl.amount += pnl_amount
-
-
-                    # **accumulate gross buy/sell**
-                    pnl_record.total_buy_eur += buy_px * match_qty
-                    pnl_record.total_sell_eur += sell_px * match_qty
-
-                    # Update remaining quantities
-                    buy_lot.quantity -= match_qty
-                    qty_to_match -= match_qty
-                    if buy_lot.quantity == 0:
-                        buys[asset_key].popleft()
-
-
-        # Build per-ticker totals
-        summary_by_ticker: dict[str, dict[str, Decimal]] = defaultdict(lambda: {
-            "realized_pnl": Decimal(0),
-            "matched_qty": Decimal(0),
-            "unmatched_qty": Decimal(0),
-            "trade_count": 0
-        })
-
-        # 1) Aggregate realized P&L and matched quantities
-        for asset_pnl in output.values():           # output is your dict[str,AssetPNL]
-            t = asset_pnl.asset.ticker
-            rec = summary_by_ticker[t]
-            rec["realized_pnl"] += asset_pnl.pnl.amount
-            rec["trade_count"] = len(asset_pnl.trades)
-            # Sum up how many units were matched (from the sell side)
-            rec["matched_qty"] += sum(trade.sell.quantity for trade in asset_pnl.trades)
-            for t in asset_pnl.trades:
-                if pd.isnull(t.buy.date):
-                    print(t.buy)
-
-
-        # 2) Tally up any remaining open buys
-        for t, queue in buys.items():
-            rec = summary_by_ticker[t]
-            rec["unmatched_qty"] = sum(lot.quantity for lot in queue)
-
-        # 3) (Optional) Convert your defaultdict back to a plain dict
-        final_summary = dict(summary_by_ticker)
-
-        # Print the final summary
-        for ticker, stats in final_summary.items():
-            if stats['unmatched_qty']>0:
-                print(f"{ticker} | "
-                    f"Realized P&L: {stats['realized_pnl']:8.2f} EUR | "
-                    f"Matched Qty: {stats['matched_qty']:6}   | "
-                    f"Unmatched Qty: {stats['unmatched_qty']:6}   | "
-                    f"Trades: {stats['trade_count']}")
-
+                by_asset[op.asset.key].append(op)
+            else:
+                asset_key = op.asset.key
+                by_asset[asset_key].append(op)
+                first_sell.setdefault(asset_key, i)
+
+        # Assets are independent: big ledgers match them on a process pool, where the
+        # Decimal-heavy loop is not serialised by the GIL; small ones are not worth
+        # pickling the operations out and the trades back
+        histories = list(by_asset.values())
+        if len(sorted_ops) >= _PARALLEL_MIN_OPS and len(histories) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(histories), os.cpu_count() or 1)) as ex:
+                matched = list(ex.map(_match_asset, histories, chunksize=8))
+        else:
+            matched = [_match_asset(ops) for ops in histories]
+        for asset_key, (pnl_record, lots) in zip(by_asset, matched):
+            buys[asset_key] = lots
+            if pnl_record is not None:
+                output[asset_key] = pnl_record
+
+        # Assets were walked one at a time; list them by first sell as before
+        output = dict(sorted(output.items(), key=lambda item: first_sell[item[0]]))
+
+        if self.verbose:
+            self._print_open_positions(output, buys)
+
+        summary = [
+            AssetPNL.model_construct(
+                asset=acc.asset,
+                pnl=Money(amount=acc.pnl, currency="EUR"),
+                trades=acc.trades,
+                total_buy_eur=acc.total_buy_eur,
+                total_sell_eur=acc.total_sell_eur,
+            )
+            for acc in output.values()
+        ]
         return TradingPerformanceOut(
             year=self.year,
-            summary=list(output.values()),
-        )
\ No newline at end of file
+            summary=summary,
+        )
+
+    def _print_open_positions(self, output: dict[str, _PNLAcc], buys: dict[str, deque[list]]) -> None:
+        """Console summary of the assets that still hold unmatched buy lots."""
+        # One pass over the lot queues: realized and matched totals were already
+        # accumulated during the match, under the same asset key
+        for asset_key, lots in buys.items():
+            unmatched_qty = sum(remaining for _, remaining in lots)
+            if unmatched_qty > 0:
+                acc = output.get(asset_key) or _PNLAcc()
+                print(f"{asset_key} | "
+                    f"Realized P&L: {acc.pnl:8.2f} EUR | "
+                    f"Matched Qty: {acc.matched_qty:6}   | "
+                    f"Unmatched Qty: {unmatched_qty:6}   | "
+                    f"Trades: {len(acc.trades)}")
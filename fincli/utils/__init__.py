@@ -1,6 +1,9 @@
-from .fx import to_eur, eur_to
+from .fx import to_eur, to_eur_batch, eur_to, rate_on, rates_asof
 
 __all__ = [
     "to_eur",
+    "to_eur_batch",
     "eur_to",
+    "rate_on",
+    "rates_asof",
 ]
@@ -1,38 +1,149 @@
 # file: fincli/fx.py
 from __future__ import annotations
+import hashlib
+import os
 from pathlib import Path
 from functools import lru_cache
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 
+import numpy as np
 import pandas as pd
 
+# Opt-in (FINCLI_FX_CACHE=1): parsed rate arrays survive between CLI runs under
+# $XDG_CACHE_HOME/fincli, one .npz per CSV path holding the mtime it was built from
+_CACHE_ENV = "FINCLI_FX_CACHE"
+_CACHE_FORMAT = 4  # bump when the cached arrays change shape
+# Table days are int64 days since 1970-01-01; a date maps there via its ordinal
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-@lru_cache
-def fx_table(csv_path: str | Path) -> pd.DataFrame:
-    """Load the ECB historical reference rates and return *daily* dataframe."""
+
+@lru_cache(maxsize=8)
+def _load_fx_table(csv_path: str, mtime: float) -> pd.DataFrame:
     df = pd.read_csv(csv_path, parse_dates=["Date"]).set_index("Date").sort_index()
     df.columns = [c.strip() for c in df.columns]  # e.g. 'USD', 'JPY'
     # convert index from Timestamps to date objects
     df.index = df.index.date
-    df.columns = [c.strip() for c in df.columns]
     return df
 
 
-def eur_to(currency: str, amount: Decimal, on: datetime, csv_path: str | Path) -> Decimal:
+def fx_table(csv_path: str | Path) -> pd.DataFrame:
+    """Load the ECB historical reference rates and return *daily* dataframe.
+
+    Parsed once per process and file version (keyed by resolved path + mtime).
+    """
+    path = Path(csv_path).resolve()
+    return _load_fx_table(str(path), path.stat().st_mtime)
+
+
+def _cache_dir() -> Path | None:
+    """Where the FX array cache lives, or None when it is not enabled."""
+    if os.environ.get(_CACHE_ENV, "") in ("", "0"):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "fincli"
+
+
+@lru_cache(maxsize=8)
+def _load_fx_arrays(csv_path: str, mtime: float) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """The table as a sorted int64 epoch-day array plus one rate array per currency.
+
+    With the cache enabled, a new process reads these from a small .npz (plain numeric
+    arrays, loaded with allow_pickle=False) instead of re-parsing the CSV.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is not None:
+        key = hashlib.sha1(f"{_CACHE_FORMAT}\0{csv_path}".encode()).hexdigest()[:16]
+        cache_path = cache_dir / f"fx_{key}.npz"
+        try:
+            with np.load(cache_path, allow_pickle=False) as npz:
+                if npz["mtime"] == mtime:
+                    return npz["days"], {k[5:]: npz[k] for k in npz.files if k.startswith("rate_")}
+        except Exception:  # missing, unreadable or stale-format cache: rebuild it
+            pass
+
+    tbl = _load_fx_table(csv_path, mtime)
+    days = np.asarray(tbl.index, dtype="datetime64[D]").view(np.int64)
+    rates = {col: tbl[col].to_numpy() for col in tbl.columns}
+    # only numeric tables are cached: anything else could not be read back without pickle
+    if cache_dir is not None and all(arr.dtype.kind in "fiu" for arr in rates.values()):
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp.open("wb") as fh:
+                np.savez(fh, mtime=np.float64(mtime), days=days, **{f"rate_{c}": a for c, a in rates.items()})
+            tmp.replace(cache_path)  # readers never see a half-written file
+        except OSError:  # read-only cache directory and the like: the cache is only an optimisation
+            pass
+    return days, rates
+
+
+def _fx_arrays(csv_path: str | Path) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    path = Path(csv_path).resolve()
+    return _load_fx_arrays(str(path), path.stat().st_mtime)
+
+
+def _row_asof(days: np.ndarray, day: date) -> int:
+    """Position of the last table day on or before `day` (weekends / holidays fall back)."""
+    row = int(days.searchsorted(day.toordinal() - _EPOCH_ORDINAL, side="right")) - 1
+    if row < 0:
+        raise KeyError(f"No FX rate on or before {day}")
+    return row
+
+
+@lru_cache(maxsize=4096)
+def _rate(csv_path: str, mtime: float, currency: str, day: date) -> Decimal:
+    """<currency> per EUR on `day`; rates are daily, so one lookup per (table, currency, day)."""
+    days, rates = _load_fx_arrays(csv_path, mtime)
+    return Decimal(str(rates[currency][_row_asof(days, day)]))
+
+
+def _to_date(on: date | datetime) -> date:
+    """Rates are daily: datetimes (and Timestamps) are looked up by their calendar day."""
+    return on.date() if isinstance(on, datetime) else on
+
+
+def rate_on(currency: str, day: date | datetime, csv_path: str | Path) -> Decimal:
+    """Cached <currency> per EUR rate on `day`.  Fallback to previous known day."""
+    path = Path(csv_path).resolve()
+    return _rate(str(path), path.stat().st_mtime, currency, _to_date(day))
+
+
+def eur_to(currency: str, amount: Decimal, on: date | datetime, csv_path: str | Path) -> Decimal:
     """Convert EUR → <currency> at date `on`.  Fallback to previous known day."""
-    tbl = fx_table(csv_path)
-    day = on
-    while day not in tbl.index:                # weekends / holidays
-        day = day - pd.Timedelta(days=1)
-    rate = Decimal(str(tbl.loc[day, currency]))
+    rate = rate_on(currency, on, csv_path)
     return amount * rate
 
-def to_eur(currency: str, amount: Decimal, on: datetime, csv_path: str | Path) -> Decimal:
+def to_eur(currency: str, amount: Decimal, on: date | datetime, csv_path: str | Path) -> Decimal:
     """Convert <currency> → EUR at date `on`.  Fallback to previous known day."""
-    tbl = fx_table(csv_path)
-    day = on.date()  # ensure we are working with date only
-    while day not in tbl.index:                # weekends / holidays
-        day = day - pd.Timedelta(days=1)
-    rate = Decimal(str(tbl.loc[day, currency]))
-    return amount / rate
\ No newline at end of file
+    rate = rate_on(currency, on, csv_path)
+    return amount / rate
+
+
+def rates_asof(currencies: list[str], days: list[date], csv_path: str | Path) -> list[Decimal]:
+    """Vectorised rate lookup: last known <currency> rate on or before each day."""
+    table_days, rates = _fx_arrays(csv_path)
+    # plain integer ordinals: much cheaper than having numpy convert each date object
+    epoch_days = np.fromiter((day.toordinal() for day in days), np.int64, len(days)) - _EPOCH_ORDINAL
+    rows = table_days.searchsorted(epoch_days, side="right") - 1
+    if len(rows) and rows.min() < 0:
+        raise KeyError(f"No FX rate on or before {min(days)}")
+    if not rates.keys() >= set(currencies):
+        raise KeyError(f"Unknown currency in {sorted(set(currencies))}")
+    # one str -> Decimal parse per distinct (currency, day) in the batch
+    parsed: dict[tuple[str, int], Decimal] = {}
+    out = []
+    for key in zip(currencies, rows.tolist()):
+        rate = parsed.get(key)
+        if rate is None:
+            rate = parsed[key] = Decimal(str(rates[key[0]][key[1]]))
+        out.append(rate)
+    return out
+
+
+def to_eur_batch(
+    currency: str, amounts: list[Decimal], dates: list[date | datetime], csv_path: str | Path
+) -> list[Decimal]:
+    """`to_eur` for many amounts in one currency: a single vectorised rate lookup for all dates."""
+    rates = rates_asof([currency] * len(dates), [_to_date(on) for on in dates], csv_path)
+    return [amount / rate for amount, rate in zip(amounts, rates)]
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from fincli.models import BinanceParserConfig, BuyOperation, SellOperation
+from fincli.parsers.binance import BinanceParser
+
+TRADES_HEADER = (
+    "Currency name,Currency amount,Acquired,Sold,Proceeds (EUR),Cost basis (EUR),"
+    "Gains (EUR),Holding period (Days),Transaction type,Label\n"
+)
+SAVINGS_HEADER = "Date,Asset,Amount,Price per unit (EUR),Value (EUR),Transaction Type,Label\n"
+
+
+class BinanceBlankCellsTest(unittest.TestCase):
+    def _load(self, trades: str, savings: str):
+        with tempfile.TemporaryDirectory() as tmp:
+            trades_file = Path(tmp, "trades.csv")
+            savings_file = Path(tmp, "savings.csv")
+            trades_file.write_text(TRADES_HEADER + trades)
+            savings_file.write_text(SAVINGS_HEADER + savings)
+            config = BinanceParserConfig(trades_path=str(trades_file), savings_path=str(savings_file))
+            return BinanceParser(config).load().records
+
+    def test_blank_cost_basis_is_zero_not_nan(self):
+        records = self._load(
+            "ADA,100,2023-03-01 10:00:00,2024-03-02 10:00:00,55.12,,15.02,367,Sell,\n",
+            "2024-01-01 10:00:00,ADA,1,0.5,,Reward,\n",
+        )
+        buy, sell, reward = records
+        self.assertIsInstance(buy, BuyOperation)
+        self.assertIsInstance(sell, SellOperation)
+        self.assertEqual(buy.unit_price.amount, Decimal(0))
+        self.assertEqual(sell.unit_price.amount, Decimal("0.5512"))
+        self.assertEqual(reward.gross.amount, Decimal(0))
+        for amount in (buy.unit_price.amount, sell.unit_price.amount, reward.gross.amount):
+            self.assertTrue(amount.is_finite())
+
+
+if __name__ == "__main__":
+    unittest.main()
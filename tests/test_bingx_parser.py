@@ -0,0 +1,45 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+from fincli.models import BingxParserConfig
+from fincli.parsers.bingx import BingxParser
+
+HEADER = "Time(UTC+8);Pair;Type;DealPrice;Quantity;Fee;Fee Coin\n"
+
+
+class BingxBlankCellsTest(unittest.TestCase):
+    def _load(self, rows: str):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "bingx.csv")
+            path.write_text(HEADER + rows)
+            return BingxParser(BingxParserConfig(path=str(path))).load().records
+
+    def test_blank_fee_is_zero(self):
+        (buy,) = self._load("2024-01-06 10:00:00;BTC-EUR;Open Long;42000.5;0.01;;EUR\n")
+        self.assertEqual(buy.commission.amount, Decimal(0))
+        self.assertEqual(buy.unit_price.amount, Decimal("42000.5"))
+
+    def test_blank_price_raises_instead_of_nan(self):
+        with self.assertRaises(ValueError):
+            self._load("2024-01-06 10:00:00;BTC-EUR;Open Long;;0.01;0.2;EUR\n")
+
+
+class BingxFeeCoinTest(unittest.TestCase):
+    def test_unsupported_fee_coin_falls_back_to_usdt(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "bingx.csv")
+            path.write_text(HEADER + "2024-01-06 10:00:00;BTC-EUR;Open Long;42000.5;0.01;0.2;BNB\n")
+            # two USD per EUR, whatever the day
+            two_per_eur = lambda currencies, days, csv: [Decimal(2)] * len(currencies)
+            with mock.patch("fincli.models.rates_asof", side_effect=two_per_eur) as rates:
+                (buy,) = BingxParser(BingxParserConfig(path=str(path))).load().records
+        self.assertEqual(rates.call_args.args[0], ["USD"])
+        self.assertEqual(buy.commission.amount, Decimal("0.10"))
+        self.assertEqual(buy.commission.currency, "EUR")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from fincli.models import BitGetParserConfig
+from fincli.parsers.bitget import BitGetParser
+
+FORMAT_A = "Date;Direction;Coin;Futures;Transaction amount;Average Price;Realized P/L;NetProfits;Fee\n"
+FORMAT_B = "Date;Trading pair;Direction;Price;Amount;Total;Fee\n"
+
+
+class BitGetBlankCellsTest(unittest.TestCase):
+    def _load(self, text: str):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "bitget.csv")
+            path.write_text(text)
+            return BitGetParser(BitGetParserConfig(path=str(path))).load().records
+
+    def test_blank_fee_is_zero_in_both_formats(self):
+        (open_long,) = self._load(FORMAT_A + "2024-02-01 10:00:00;Open Long;EUR;BTCEUR;0.02;43000;0;0;\n")
+        (buy,) = self._load(FORMAT_B + "2024-03-01 10:00:00;ETH/EUR;Buy;3000;1;3000;\n")
+        for record in (open_long, buy):
+            self.assertEqual(record.commission.amount, Decimal(0))
+            self.assertTrue(record.unit_price.amount.is_finite())
+
+    def test_nan_text_raises(self):
+        with self.assertRaises(ValueError):
+            self._load(FORMAT_B + "2024-03-01 10:00:00;ETH/EUR;Buy;NaN;1;3000;1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
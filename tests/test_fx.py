@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from fincli.utils import fx
+
+FX_CSV = "Date,USD,GBP,\n2024-01-05,1.0950,0.8620,\n2024-01-03,1.0920,0.8660,\n2024-01-02,1.0956,0.8680,\n"
+
+
+class FxTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.csv = self.tmp / "eurofxref-hist.csv"
+        self.csv.write_text(FX_CSV)
+        for cached in (fx._load_fx_table, fx._load_fx_arrays, fx._rate):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+        # whatever the caller's shell says, the on-disk cache stays off unless a test enables it
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("FINCLI_FX_CACHE", None)
+
+
+class FxArrayCacheTest(FxTestCase):
+    def test_cache_is_off_by_default(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.tmp / "xdg")}):
+            fx._fx_arrays(self.csv)
+        self.assertFalse((self.tmp / "xdg").exists())
+
+    def test_arrays_round_trip_through_the_npz_cache(self):
+        env = {"FINCLI_FX_CACHE": "1", "XDG_CACHE_HOME": str(self.tmp / "xdg")}
+        with mock.patch.dict(os.environ, env):
+            days, rates = fx._fx_arrays(self.csv)
+            (cache_file,) = (self.tmp / "xdg" / "fincli").glob("fx_*.npz")
+            fx._load_fx_arrays.cache_clear()
+            with mock.patch.object(fx, "_load_fx_table", side_effect=AssertionError("CSV re-parsed")):
+                cached_days, cached_rates = fx._fx_arrays(self.csv)
+        np.testing.assert_array_equal(cached_days, days)
+        self.assertEqual(cached_rates.keys(), rates.keys())
+        for currency in rates:
+            np.testing.assert_array_equal(cached_rates[currency], rates[currency])
+        # plain arrays only: readable without pickle
+        np.load(cache_file, allow_pickle=False).close()
+
+
+class AsOfLookupTest(FxTestCase):
+    # table days: Tue 2024-01-02, Wed 01-03, Fri 01-05 (Thu 01-04 missing)
+
+    def test_exact_day(self):
+        self.assertEqual(fx.rates_asof(["USD", "GBP"], [date(2024, 1, 3)] * 2, self.csv),
+                         [Decimal("1.092"), Decimal("0.866")])
+        self.assertEqual(fx.rate_on("USD", date(2024, 1, 5), self.csv), Decimal("1.095"))
+
+    def test_gap_and_weekend_days_fall_back_to_the_previous_rate(self):
+        days = [date(2024, 1, 4), date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 2)]
+        expected = [Decimal("1.092"), Decimal("1.095"), Decimal("1.095"), Decimal("1.0956")]
+        self.assertEqual(fx.rates_asof(["USD"] * 4, days, self.csv), expected)
+        self.assertEqual([fx.rate_on("USD", day, self.csv) for day in days], expected)
+        # datetimes are looked up by their calendar day
+        self.assertEqual(fx.rate_on("USD", datetime(2024, 1, 4, 23, 59), self.csv), Decimal("1.092"))
+
+    def test_day_before_the_first_rate_raises(self):
+        with self.assertRaises(KeyError):
+            fx.rates_asof(["USD", "USD"], [date(2024, 1, 3), date(2024, 1, 1)], self.csv)
+        with self.assertRaises(KeyError):
+            fx.rate_on("USD", date(2024, 1, 1), self.csv)
+        with self.assertRaises(KeyError):
+            fx.to_eur_batch("USD", [Decimal(1)], [datetime(2023, 12, 31, 12)], self.csv)
+
+    def test_unknown_currency_raises(self):
+        with self.assertRaises(KeyError):
+            fx.rates_asof(["JPY"], [date(2024, 1, 3)], self.csv)
+
+    def test_to_eur_batch_matches_to_eur(self):
+        amounts = [Decimal("109.20"), Decimal("10"), Decimal("1")]
+        dates = [datetime(2024, 1, 3, 9), datetime(2024, 1, 6, 12), date(2024, 1, 2)]
+        self.assertEqual(
+            fx.to_eur_batch("USD", amounts, dates, self.csv),
+            [fx.to_eur("USD", amount, on, self.csv) for amount, on in zip(amounts, dates)],
+        )
+        self.assertEqual(fx.to_eur_batch("USD", amounts[:1], dates[:1], self.csv), [Decimal(100)])
+        self.assertEqual(fx.to_eur_batch("USD", [], [], self.csv), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import json
+import unittest
+from decimal import Decimal
+
+from jinja2 import Environment
+
+from fincli.output.html_report import _dumps
+
+
+class TojsonTest(unittest.TestCase):
+    def setUp(self):
+        # wired the way HtmlReportOutput wires its environment
+        self.env = Environment(autoescape=True)
+        self.env.policies["json.dumps_function"] = _dumps
+        self.env.policies["json.dumps_kwargs"] = {}
+
+    def test_indent_is_honoured(self):
+        value = {"a": 1, "b": [1, 2]}
+        rendered = self.env.from_string("{{ value|tojson(indent=2) }}").render(value=value)
+        self.assertEqual(rendered, json.dumps(value, indent=2))
+
+    def test_decimals_and_html_escaping(self):
+        rendered = self.env.from_string("{{ value|tojson }}").render(value={"x": Decimal("1.50"), "s": "</script>"})
+        self.assertEqual(rendered, '{"x":"1.50","s":"\\u003c/script\\u003e"}')
+
+    def test_unsupported_options_raise(self):
+        self.env.policies["json.dumps_kwargs"] = {"sort_keys": True}
+        with self.assertRaises(TypeError):
+            self.env.from_string("{{ value|tojson }}").render(value={"b": 1, "a": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
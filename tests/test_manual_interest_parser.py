@@ -0,0 +1,30 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from fincli.models import ManualInterestParserConfig
+from fincli.parsers.manual_interest import ManualInterestParser
+
+HEADER = "year;quantity;currency;tax;source\n"
+
+
+class ManualInterestBlankCellsTest(unittest.TestCase):
+    def _load(self, rows: str):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "manual.csv")
+            path.write_text(HEADER + rows)
+            return ManualInterestParser(ManualInterestParserConfig(path=str(path))).load().records
+
+    def test_rows_without_a_year_are_skipped(self):
+        (interest,) = self._load("2024;12.5;EUR;2.1;Bank X\nbad;1;EUR;0;Y\n")
+        self.assertEqual(interest.gross.amount, Decimal("12.5"))
+        self.assertEqual(interest.tax.amount, Decimal("2.1"))
+
+    def test_blank_amount_raises_instead_of_nan(self):
+        with self.assertRaises(ValueError):
+            self._load("2024;;EUR;2.1;Bank X\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+from decimal import Decimal
+
+from fincli.models import _eur_money
+
+
+class EurMoneyInterningTest(unittest.TestCase):
+    def test_equal_amounts_that_print_differently_are_not_shared(self):
+        negative_zero = _eur_money(Decimal("-0.00"))
+        zero = _eur_money(Decimal("0.00"))
+        self.assertEqual(str(negative_zero), "-0.00 EUR")
+        self.assertEqual(str(zero), "0.00 EUR")
+        self.assertEqual(str(_eur_money(Decimal("1.0")).amount), "1.0")
+        self.assertEqual(str(_eur_money(Decimal("1.00")).amount), "1.00")
+
+    def test_identical_amounts_are_interned(self):
+        self.assertIs(_eur_money(Decimal("12.34")), _eur_money(Decimal("12.34")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+
+from fincli.models import Asset, BuyOperation, Money, RawDataOut, SellOperation, TradingPerformanceIn
+from fincli.output.pdf_report import PdfReportOutput, _asset_label
+from fincli.processors.trading_performance import TradingPerformanceProcessor
+
+
+def _eur(amount) -> Money:
+    return Money(amount=Decimal(amount), currency="EUR")
+
+
+def _ledger(n_assets: int = 30, lots: int = 6) -> list:
+    """Every asset bought `lots` times in 2023 and sold off one lot at a time in 2024."""
+    ops = []
+    for a in range(n_assets):
+        asset = Asset(name=f"Asset {a:02d}", ticker=f"T{a:02d}")
+        for i in range(lots):
+            ops.append(BuyOperation(asset=asset, unit_price=_eur(10 + i), quantity=Decimal(2),
+                                    commission=_eur(1), date=datetime(2023, 1, 1) + timedelta(days=a + i)))
+            ops.append(SellOperation(asset=asset, unit_price=_eur(12 + i), quantity=Decimal(2),
+                                     commission=_eur(1), date=datetime(2024, 1, 1) + timedelta(days=a + i)))
+    return ops
+
+
+class LazySectionRenderTest(unittest.TestCase):
+    """The per-asset and raw-data sections are built while ReportLab lays the report out."""
+
+    def test_every_section_is_drawn_once_in_order_across_pages(self):
+        ops = _ledger()
+        trading = TradingPerformanceProcessor(2024).process(TradingPerformanceIn(operations=ops))
+        raw = RawDataOut(parser_name="fixture", records=ops)
+
+        drawn: list[tuple[int, object]] = []
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            SimpleDocTemplate, "afterFlowable", autospec=True,
+            side_effect=lambda doc, flowable: drawn.append((doc.page, flowable)),
+        ):
+            out = Path(PdfReportOutput(out_file=str(Path(tmp, "report.pdf"))).render(raw, trading))
+            self.assertTrue(out.read_bytes().startswith(b"%PDF"))
+
+        texts = [(page, f.getPlainText()) for page, f in drawn if isinstance(f, Paragraph)]
+        asset_headings = [text for _, text in texts if text.startswith("Asset: ")]
+        expected = [f"Asset: {_asset_label(row.asset)}" for row in trading.summary]
+        self.assertEqual(asset_headings, expected)
+        self.assertEqual([text for _, text in texts if text.startswith("Source Parser: ")],
+                         ["Source Parser: fixture"])
+
+        # each asset heading is followed by (part of) its trade table before the next heading
+        kinds = [
+            "heading" if isinstance(f, Paragraph) and f.getPlainText().startswith(("Asset: ", "Source Parser: "))
+            else "table" if isinstance(f, Table) else "other"
+            for _, f in drawn
+        ]
+        starts = [i for i, kind in enumerate(kinds) if kind == "heading"]
+        for start, end in zip(starts, starts[1:] + [len(kinds)]):
+            self.assertIn("table", kinds[start + 1:end])
+
+        # the sections really were laid out over many pages, the raw data after the trades
+        pages = [page for page, _ in texts]
+        self.assertGreater(max(pages), 5)
+        raw_page = next(page for page, text in texts if text.startswith("Source Parser: "))
+        last_asset_page = max(page for page, text in texts if text.startswith("Asset: "))
+        self.assertGreater(raw_page, last_asset_page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from fincli.models import Interest, RevolutParserConfig
+from fincli.parsers.revolut import RevolutParser, _parse_spanish_datetimes
+
+EXPORT = """\
+Date;Description;Value, EUR;Price per share;Quantity of shares
+31 dic 2024, 1:29:07;Interest PAID EUR Class R IE000;0,12;;
+31 dic 2024, 1:29:07;Service Fee Charged EUR Class R;-0,01;;
+15 mayo 2024, 3:00:00;Interest PAID EUR Class R IE000;0,50;;
+15 mayo 2024, 3:00:00;Interest Tax;-0,09;;
+15 mayo 2024, 3:00:00;Service Fee Charged;-0,02;;
+1 sept 2024, 10:00:00;BUY EUR Class R;100,00;1;100
+
+2 sept 2024, 10:00:00;SELL EUR Class R;-50,00;1;50
+2 sept 2024, 10:00:00;Something else;1,00;1;50
+bad date;Interest PAID;1,00;;
+3 foo 2024, 10:00:00;Interest PAID EUR;1,00;;
+3 ene 2024, 10:00:00;Interest PAID EUR;abc;;
+4 feb 2024, 10:00:00;Interest PAID EUR;0,33;;
+"""
+
+
+class SpanishDatetimeTest(unittest.TestCase):
+    def test_every_month_name(self):
+        names = ["ene", "feb", "mar", "abr", "mayo", "jun", "jul", "ago", "sept", "oct", "nov", "dic"]
+        parsed = _parse_spanish_datetimes(pd.Series([f"5 {name} 2024, 7:08:09" for name in names]))
+        self.assertEqual(list(parsed), [datetime(2024, month, 5, 7, 8, 9) for month in range(1, 13)])
+
+    def test_case_and_spacing_are_tolerated(self):
+        parsed = _parse_spanish_datetimes(pd.Series([" 31  DIC 2024, 1:29:07 "]))
+        self.assertEqual(parsed[0], datetime(2024, 12, 31, 1, 29, 7))
+
+    def test_unknown_month_and_garbage_are_nat(self):
+        parsed = _parse_spanish_datetimes(pd.Series(["3 foo 2024, 10:00:00", "3 septiembre 2024, 10:00:00", "bad date"]))
+        self.assertTrue(parsed.isna().all())
+
+
+class RevolutAggregationTest(unittest.TestCase):
+    def test_lines_sharing_a_timestamp_form_one_interest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "revolut.csv")
+            path.write_text(EXPORT)
+            records = RevolutParser(RevolutParserConfig(path=str(path))).load().records
+
+        self.assertTrue(all(isinstance(r, Interest) for r in records))
+        got = [(r.date, r.gross.amount, r.tax.amount, r.commission.amount) for r in records]
+        self.assertEqual(got, [
+            # gross is net of the fee line; tax and fee keep their sign
+            (datetime(2024, 12, 31, 1, 29, 7), Decimal("0.13"), Decimal(0), Decimal("-0.01")),
+            (datetime(2024, 5, 15, 3, 0), Decimal("0.52"), Decimal("-0.09"), Decimal("-0.02")),
+            # two lines, so not a lone movement: kept, with nothing to count
+            (datetime(2024, 9, 2, 10, 0), Decimal(0), Decimal(0), Decimal(0)),
+            # unparseable date / month / amount lines are dropped, the lone BUY too
+            (datetime(2024, 2, 4, 10, 0), Decimal("0.33"), Decimal(0), Decimal(0)),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from fincli.models import BuyOperation, TRParserConfig
+from fincli.parsers.trade_republic import TradeRepublicParser
+
+HEADER = "Fecha;Tipo;Valor;Nota;ISIN;Cantidad;Comisiones\n"
+
+
+class TradeRepublicBlankCellsTest(unittest.TestCase):
+    def _load(self, rows: str):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "tr.csv").write_text(HEADER + rows)
+            return TradeRepublicParser(TRParserConfig(data_dir=tmp)).load().records
+
+    def test_blank_optional_cells_take_their_defaults(self):
+        (buy,) = self._load("2024-02-01;Compra;-2000;;;;\n")
+        self.assertIsInstance(buy, BuyOperation)
+        self.assertEqual(buy.quantity, Decimal(1))
+        self.assertEqual(buy.commission.amount, Decimal(0))
+        self.assertEqual(buy.unit_price.amount, Decimal(2000))
+        self.assertEqual(buy.asset.name, "Undefined")
+        self.assertIsNone(buy.asset.isin)
+
+    def test_blank_amount_raises_instead_of_nan(self):
+        with self.assertRaises(ValueError):
+            self._load("2024-02-01;Compra;;iShares MSCI World;IE00B4L5Y983;25.5;-1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
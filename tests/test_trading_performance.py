@@ -0,0 +1,79 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from fincli.models import Asset, BuyOperation, Money, SellOperation, TradingPerformanceIn
+from fincli.processors import trading_performance
+from fincli.processors.trading_performance import TradingPerformanceProcessor
+
+A = Asset(name="Alpha", isin="US0378331005")
+B = Asset(name="Beta", ticker="BETA")
+C = Asset(name="Gamma", ticker="GAM")
+
+
+def _eur(amount) -> Money:
+    return Money(amount=Decimal(amount), currency="EUR")
+
+
+def _buy(asset, qty, price, day, fee="0") -> BuyOperation:
+    return BuyOperation(asset=asset, unit_price=_eur(price), quantity=Decimal(qty), commission=_eur(fee), date=day)
+
+
+def _sell(asset, qty, price, day, fee="0") -> SellOperation:
+    return SellOperation(asset=asset, unit_price=_eur(price), quantity=Decimal(qty), commission=_eur(fee), date=day)
+
+
+LEDGER = [
+    # Alpha: three lots, sold in two partial chunks that straddle lot boundaries
+    _buy(A, 10, 100, datetime(2023, 1, 1), fee="1"),
+    _buy(A, 5, 110, datetime(2023, 6, 1)),
+    _sell(A, 12, 130, datetime(2024, 2, 1), fee="2"),   # 10 @ 100 + 2 @ 110
+    _buy(A, 8, 120, datetime(2024, 1, 10)),
+    _sell(A, 4, 125, datetime(2024, 3, 1), fee="1"),    # 3 @ 110 + 1 @ 120
+    # Beta: bought and sold at the same instant (the buy is matched first), oversold
+    _sell(B, 5, 60, datetime(2024, 1, 15)),
+    _buy(B, 3, 50, datetime(2024, 1, 15)),
+    # Gamma: never sold, so no summary row
+    _buy(C, 1, 10, datetime(2024, 5, 1)),
+]
+
+
+class FifoMatchingTest(unittest.TestCase):
+    def _process(self):
+        return TradingPerformanceProcessor(2024).process(TradingPerformanceIn(operations=list(LEDGER)))
+
+    def test_partial_lots_across_several_buys(self):
+        beta, alpha = self._process().summary  # ordered by first sell of the year
+
+        self.assertEqual(alpha.asset, A)
+        # the sell's commission is charged on every lot it matches
+        self.assertEqual([t.pnl.amount for t in alpha.trades], [Decimal(298), Decimal(38), Decimal(44), Decimal(4)])
+        self.assertEqual([t.buy.unit_price.amount for t in alpha.trades], [Decimal(100), Decimal(110), Decimal(110), Decimal(120)])
+        self.assertEqual(alpha.pnl, _eur(384))
+        self.assertEqual(alpha.total_buy_eur, Decimal(1670))
+        self.assertEqual(alpha.total_sell_eur, Decimal(2060))
+
+        self.assertEqual(beta.asset, B)
+        self.assertEqual(len(beta.trades), 1)  # only the 3 bought units can be matched
+        self.assertEqual(beta.pnl, _eur(30))
+        self.assertEqual((beta.total_buy_eur, beta.total_sell_eur), (Decimal(150), Decimal(180)))
+
+    def test_input_operations_are_not_mutated(self):
+        before = [op.model_dump() for op in LEDGER]
+        self._process()
+        self.assertEqual([op.model_dump() for op in LEDGER], before)
+
+    def test_process_pool_gives_identical_summary(self):
+        serial = self._process()
+        with mock.patch.object(trading_performance, "_PARALLEL_MIN_OPS", 0), \
+                mock.patch.object(trading_performance, "ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            parallel = self._process()
+        pool.assert_called_once()
+        self.assertEqual(parallel.summary, serial.summary)
+        self.assertEqual([a.model_dump() for a in parallel.summary], [a.model_dump() for a in serial.summary])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from fincli.models import BuyOperation, Dividend, Interest, SellOperation, XTBParserConfig
+from fincli.parsers.xtb import XTBParser, group_within_threshold
+
+TRADES = """\
+Nombre;ISIN;Ticker;Posición;Volumen;Compra;;Venta;;Comisión transacción;Rollovers;Swaps;Impuesto sobre transacciones financieras o similares;Resultado neto{extra_hdr1}
+;;;;;Fecha;Importe transacción (EUR);Fecha;Importe transacción (EUR);( EUR);(EUR);(EUR);(EUR);(EUR){extra_hdr2}
+Apple;US0378331005;AAPL.US;Alcista;2,00;05/01/2024;300,00;10/02/2024;350,00;1,00;0,00;-0,50;0,20;{apple_pnl}{extra}
+Nvidia;;NVDA.US;Bajista;1,50;05/04/2024;1.000,00;01/03/2024;900,00;0,00;0,00;0,00;0,00;-100,00{extra}
+;;;;;;;;;;;;;{blank_extra}
+"""
+
+CASH = """\
+ID;Type;Time;Comment;Symbol;Amount
+5;deposit;20/03/2024 09:00:00;dep;;1000,00
+1;Free-funds Interest;01/02/2024 10:00:00;Interest;;1,23
+2;Free-funds Interest Tax;01/02/2024 10:00:05;tax;;-0,23
+3;DIVIDENT;15/03/2024 12:00:00;div;AAPL.US;1.234,56
+4;Withholding Tax;15/03/2024 12:00:01;wt;AAPL.US;-185,18
+6;DIVIDENT;15/03/2024 12:00:02;div;MSFT.US;10,00
+7;Free-funds Interest;01/03/2024 10:00:00;Interest;;0,77
+"""
+
+
+def _trades(apple_pnl: str = "48,50", duplicate_headers: bool = False) -> str:
+    # duplicate_headers: two more columns whose combined names repeat existing ones
+    extra = dict(extra_hdr1=";Nombre;Nota;Nota", extra_hdr2=";;;", extra=";dup;a;b", blank_extra=";;;") \
+        if duplicate_headers else dict(extra_hdr1="", extra_hdr2="", extra="", blank_extra="")
+    return TRADES.format(apple_pnl=apple_pnl, **extra)
+
+
+class GroupWithinThresholdTest(unittest.TestCase):
+    @staticmethod
+    def _row(time: str, typ: str = "DIVIDENT", amount: str = "1,00") -> list[str]:
+        return ["1", typ, time, "comment", "AAPL.US", amount]
+
+    def test_gap_equal_to_threshold_stays_in_group(self):
+        groups = group_within_threshold([
+            self._row("01/02/2024 10:00:00"),
+            self._row("01/02/2024 10:00:10"),  # exactly 10s after: same group
+            self._row("01/02/2024 10:00:21"),  # 11s after: new group
+        ], threshold_seconds=10)
+        self.assertEqual([[e["dt"] for e in g] for g in groups], [
+            [datetime(2024, 2, 1, 10, 0, 0), datetime(2024, 2, 1, 10, 0, 10)],
+            [datetime(2024, 2, 1, 10, 0, 21)],
+        ])
+
+    def test_rows_are_sorted_stably_and_amounts_parsed(self):
+        groups = group_within_threshold([
+            self._row("01/03/2024 10:00:00", amount="3,00"),
+            self._row("01/02/2024 10:00:00", "Free-funds Interest", "1.234,56"),
+            self._row("01/02/2024 10:00:00", "Free-funds Interest Tax", "-0,23"),
+        ])
+        self.assertEqual([[(e["type"], e["amount"]) for e in g] for g in groups], [
+            [("Free-funds Interest", Decimal("1234.56")), ("Free-funds Interest Tax", Decimal("-0.23"))],
+            [("DIVIDENT", Decimal("3.00"))],
+        ])
+
+
+class XTBParserTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def _parser(self, trades: str, strict_pnl: bool = False) -> XTBParser:
+        (self.tmp / "trades.csv").write_text(trades, encoding="utf-8")
+        (self.tmp / "cash.csv").write_text(CASH, encoding="utf-8")
+        return XTBParser(XTBParserConfig(
+            cash_file=str(self.tmp / "cash.csv"), trades_file=str(self.tmp / "trades.csv"), strict_pnl=strict_pnl,
+        ))
+
+    def _parse_trades(self, trades: str, strict_pnl: bool = False) -> list:
+        parser = self._parser(trades, strict_pnl)
+        return parser._parse_trades(Path(parser.config.trades_file))
+
+    def test_trades_become_buy_sell_pairs(self):
+        for strict_pnl in (False, True):
+            with self.subTest(strict_pnl=strict_pnl):
+                buy, sell, short_buy, short_sell = self._parse_trades(_trades(), strict_pnl)
+                self.assertIsInstance(buy, BuyOperation)
+                self.assertIsInstance(sell, SellOperation)
+                self.assertEqual(buy.unit_price.amount, Decimal(150))
+                self.assertEqual(sell.unit_price.amount, Decimal(175))
+                # commission + |rollovers| + |swaps|
+                self.assertEqual(sell.commission.amount, Decimal("1.50"))
+                self.assertEqual(sell.tax.amount, Decimal("0.20"))
+                self.assertIsNone(short_buy.asset.isin)
+                # a short ("Bajista") has its dates swapped so the buy comes first
+                self.assertEqual((short_buy.date, short_sell.date), (datetime(2024, 3, 1), datetime(2024, 4, 5)))
+
+    def test_duplicate_headers_parse_like_the_plain_export(self):
+        for strict_pnl in (False, True):
+            with self.subTest(strict_pnl=strict_pnl):
+                self.assertEqual(
+                    self._parse_trades(_trades(duplicate_headers=True), strict_pnl),
+                    self._parse_trades(_trades(), strict_pnl),
+                )
+
+    def test_pnl_mismatch_only_raises_when_strict(self):
+        self.assertEqual(len(self._parse_trades(_trades(apple_pnl="10,00"))), 4)
+        with self.assertRaises(ValueError):
+            self._parse_trades(_trades(apple_pnl="10,00"), strict_pnl=True)
+
+    def test_empty_or_header_only_file_has_no_trades(self):
+        header_only = "".join(_trades().splitlines(keepends=True)[:2])
+        self.assertEqual(self._parse_trades(""), [])
+        self.assertEqual(self._parse_trades(header_only), [])
+
+    def test_cash_interest_and_dividends(self):
+        records = self._parser(_trades()).load().records
+        interests = [(r.gross.amount, r.tax.amount) for r in records if isinstance(r, Interest)]
+        dividends = [(r.asset.ticker, r.gross.amount, r.tax.amount) for r in records if isinstance(r, Dividend)]
+        self.assertEqual(interests, [(Decimal("1.23"), Decimal("0.23")), (Decimal("0.77"), Decimal(0))])
+        self.assertEqual(dividends, [
+            ("AAPL.US", Decimal("1234.56"), Decimal("-185.18")),
+            ("MSFT.US", Decimal("10.00"), Decimal(0)),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()